@@ -12,43 +12,75 @@ Use this for:
 Most users should use the installed 'route-planner' command instead.
 """
 
+import json
 import os
-import platform
 import subprocess
 import sys
 from pathlib import Path
 
-# Add the current directory to sys.path if needed
+# Resolve the host platform once at import time (no uname() call needed)
+_IS_WIN = sys.platform == "win32"
+_SCRIPT_EXT = ".bat" if _IS_WIN else ".sh"
+
+# Directory containing this launcher
 current_dir = Path(__file__).parent.absolute()
-if str(current_dir) not in sys.path:
-    sys.path.insert(0, str(current_dir))
 
-try:
-    # Try to import from the package
-    from route_planner.paths import get_app_dir, get_platform_script
-except ImportError:
-    # If that fails, try to import directly
-    sys.path.insert(0, str(current_dir / 'route_planner'))
+# Resolved launch paths are cached here so warm starts skip the import chain
+_LAUNCHER_CACHE = Path.home() / '.cache' / 'route_planner' / 'launcher.json'
+
+def _resolve_launch_paths():
+    """Resolve the project root and platform script via the package helpers."""
+    # Add the current directory to sys.path if needed
+    if str(current_dir) not in sys.path:
+        sys.path.insert(0, str(current_dir))
+    
     try:
-        from paths import get_app_dir, get_platform_script
+        # Try to import from the package
+        from route_planner.paths import get_app_dir, get_platform_script
     except ImportError:
-        # If all else fails, define the functions directly
-        def get_app_dir():
-            return Path(__file__).parent.absolute()
-        
-        def get_platform_script(script_name):
-            app_dir = get_app_dir()
-            if platform.system() == "Windows":
-                return app_dir / f"{script_name}.bat"
-            else:
-                return app_dir / f"{script_name}.sh"
+        # If that fails, try to import directly
+        sys.path.insert(0, str(current_dir / 'route_planner'))
+        try:
+            from paths import get_app_dir, get_platform_script
+        except ImportError:
+            # If all else fails, define the functions directly
+            def get_app_dir():
+                return Path(__file__).parent.absolute()
+            
+            def get_platform_script(script_name):
+                return get_app_dir() / f"{script_name}{_SCRIPT_EXT}"
+    
+    return get_app_dir(), get_platform_script('run_route_planner')
+
+def _get_launch_paths():
+    """Return (project_root, script_path), using the on-disk cache when valid."""
+    try:
+        cached = json.loads(_LAUNCHER_CACHE.read_text(encoding='utf-8'))
+        if cached['launcher'] == str(current_dir):
+            script_path = Path(cached['script_path'])
+            if script_path.exists():
+                return Path(cached['project_root']), script_path
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    
+    project_root, script_path = _resolve_launch_paths()
+    if script_path.exists():
+        try:
+            _LAUNCHER_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            _LAUNCHER_CACHE.write_text(json.dumps({
+                'launcher': str(current_dir),
+                'project_root': str(project_root),
+                'script_path': str(script_path),
+            }), encoding='utf-8')
+        except OSError:
+            # Caching is best-effort only
+            pass
+    return project_root, script_path
 
 def main():
     """Main entry point that delegates to platform-specific scripts."""
-    project_root = get_app_dir()
-    
     # Determine which script to run based on platform
-    script_path = get_platform_script('run_route_planner')
+    project_root, script_path = _get_launch_paths()
     
     if not script_path.exists():
         print(f"❌ {script_path.name} not found")
@@ -57,7 +89,7 @@ def main():
     # Execute the appropriate script
     try:
         # Pass any command line arguments to the script
-        if platform.system() == "Windows":
+        if _IS_WIN:
             process = subprocess.Popen([str(script_path)] + sys.argv[1:], 
                                     cwd=str(project_root), shell=True)
         else:
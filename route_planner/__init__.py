@@ -10,40 +10,48 @@ and comprehensive offline support.
 
 def _get_version():
     """Get version from git tags (single source of truth) or fallback."""
+    from pathlib import Path
+    project_root = Path(__file__).parent.parent
+    cache_file = Path(__file__).parent / '_version.txt'
+    git_head = project_root / '.git' / 'HEAD'
+
+    # Reuse the cached version unless git state changed since it was written
+    try:
+        cache_mtime = cache_file.stat().st_mtime
+        if not git_head.exists() or git_head.stat().st_mtime <= cache_mtime:
+            cached = cache_file.read_text(encoding='utf-8').strip()
+            if cached:
+                return cached
+    except OSError:
+        pass
+
     try:
         import subprocess
-        from pathlib import Path
-        project_root = Path(__file__).parent.parent
         result = subprocess.run(
             ['git', 'describe', '--tags', '--abbrev=0'],
             cwd=project_root,
             capture_output=True,
             text=True,
-            check=True
+            check=True,
+            timeout=2
         )
-        return result.stdout.strip().lstrip('v')
-    except (subprocess.CalledProcessError, FileNotFoundError, ImportError):
+        version = result.stdout.strip().lstrip('v')
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError, ImportError):
         # Fallback for environments without git or in packaged distributions
         return "1.1.13"
 
+    try:
+        cache_file.write_text(version, encoding='utf-8')
+    except OSError:
+        # Read-only installs simply skip the cache
+        pass
+    return version
+
 __version__ = _get_version()
 __author__ = "Route Planner Development Team"
 
-# Ensure config is available at package level
-try:
-    import sys
-    from pathlib import Path
-    
-    # Add project root to path for config import
-    project_root = Path(__file__).parent.parent
-    if str(project_root) not in sys.path:
-        sys.path.insert(0, str(project_root))
-    
-    # Import config so it's available to all modules
-    from config import *
-except ImportError:
-    # Fallback configuration
-    pass
+# Make configuration available at package level
+from .config import *
 
 # Import core functionality
 from route_planner.core import main
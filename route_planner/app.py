@@ -23,7 +23,7 @@ Architecture:
 - Algorithms: Custom TSP implementations with NetworkX graph processing
 - Data: OpenStreetMap integration via OSMnx library
 - Caching: File-based caching system for offline operation
-- Threading: QThread-based background processing
+- Threading: QThreadPool-based background processing
 
 Algorithm Details:
 1. Held-Karp Algorithm:
@@ -59,6 +59,9 @@ License: MIT
 Version: Dynamic (from package __version__)
 """
 
+# Annotations stay unevaluated so lazily imported modules can appear in signatures
+from __future__ import annotations
+
 # =============================================================================
 # IMPORT DECLARATIONS
 # =============================================================================
@@ -71,11 +74,23 @@ import random       # Random number generation for sample data
 import tempfile     # Temporary file creation for map rendering
 import contextlib   # Context management utilities
 import logging      # Logging framework for debugging and monitoring
+import logging.handlers  # Queue-based handlers for non-blocking log output
+import queue        # Thread-safe queue feeding the background log writer
+import atexit       # Shutdown hooks for flushing background log output
 import hashlib      # Cryptographic hashing for cache key generation
 import json         # JSON serialization for data persistence
 import functools    # Higher-order functions and operations on callable objects
+import collections  # Ordered dicts for the in-memory cache tier
+import importlib    # Deferred imports of the heavy mapping libraries
+import threading    # Locks for thread-safe lazy imports
+import concurrent.futures  # Concurrent connectivity probes
+import math         # Rounding for graph cache bounds
+import pickle       # Binary serialization for cached road network graphs
 from pathlib import Path                                    # Object-oriented filesystem paths
-from typing import List, Tuple, Dict, Any, Optional, Union, Set, Callable, TypeVar, cast  # Type hints for better code documentation
+from typing import List, Tuple, Dict, Any, Optional, Union, Set, Callable, TypeVar, NamedTuple, Sequence, cast  # Type hints for better code documentation
+
+# Environment setup; must run before PyQt5 (and QtWebEngine) is first imported
+os.environ.setdefault("QTWEBENGINE_DISABLE_SANDBOX", "1")  # Required for QtWebEngine
 
 # GUI framework imports - PyQt5 provides the desktop application framework
 from PyQt5 import QtWidgets, QtGui, QtCore                 # Core GUI components and utilities
@@ -93,18 +108,90 @@ except ImportError:
     HAS_WEB_ENGINE = False
     print("Warning: QtWebEngineWidgets not available. Map display will be limited.")
 
-from PyQt5.QtCore import QTimer, QPropertyAnimation, QRect, QEasingCurve  # Animation and timing utilities
+from PyQt5.QtCore import QTimer  # Deferred UI callbacks
+
+class _LazyModule:
+    """
+    Placeholder for a module that is imported on first attribute access.
+    
+    osmnx (via geopandas/pandas) and folium add about half a second to startup,
+    yet are only needed once a map is drawn or a route is planned. The first
+    attribute access imports the module and rebinds the module-level name to
+    it, so later lookups go straight to the real module.
+    """
+    
+    def __init__(self, module_name: str, alias: str):
+        self._module_name = module_name
+        self._alias = alias
+        self._lock = threading.Lock()
+        
+    def __getattr__(self, attr: str) -> Any:
+        with self._lock:
+            module = importlib.import_module(self._module_name)
+            globals()[self._alias] = module
+        return getattr(module, attr)
 
 # Scientific computing and algorithm libraries
-import networkx as nx      # Graph data structures and algorithms
-import folium             # Interactive web maps with Leaflet.js
-import osmnx as ox        # OpenStreetMap network analysis and data retrieval
-from shapely.geometry import box  # Geometric operations for bounding box calculations
+import numpy as np         # Array-backed DP tables for the TSP solvers
+nx = _LazyModule("networkx", "nx")      # Graph data structures and algorithms
+folium = _LazyModule("folium", "folium")  # Interactive web maps with Leaflet.js
+ox = _LazyModule("osmnx", "ox")         # OpenStreetMap network analysis and data retrieval
+
+# Optional fast JSON codec for cache files - the standard json module is used without it
+try:
+    import orjson         # Rust-backed JSON encoder/decoder working directly on bytes
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+def json_dumps_bytes(obj: Any, sort_keys: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when available."""
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, sort_keys=sort_keys).encode()
+
+def json_loads_bytes(data: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Optional compressor for cached road networks - graphs are stored uncompressed without it
+try:
+    import zstandard      # Fast zstd compression of pickled graphs
+    HAS_ZSTD = True
+except ImportError:
+    zstandard = None
+    HAS_ZSTD = False
+
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"  # Leading bytes of every zstd frame
+
+def compress_cache_bytes(data: bytes) -> bytes:
+    """Compress a cache payload with zstd level 3 when zstandard is available."""
+    if HAS_ZSTD:
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return data
+
+def decompress_cache_bytes(data: bytes) -> bytes:
+    """Undo compress_cache_bytes; uncompressed payloads are returned as-is."""
+    if data.startswith(ZSTD_MAGIC):
+        if not HAS_ZSTD:
+            raise ValueError("cache entry is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return data
+
+# Optional JIT compiler for the TSP inner loops - pure NumPy is used without it
+try:
+    import numba          # Compiles the Held-Karp kernel to machine code
+    HAS_NUMBA = True
+except ImportError:
+    numba = None
+    HAS_NUMBA = False
 
 # Network connectivity and offline support
-import urllib.request      # URL handling for internet connectivity checks
-import urllib.error       # URL error handling
-import socket             # Low-level networking interface
+import socket             # Low-level networking interface for connectivity checks
 
 # Version information
 try:
@@ -118,7 +205,7 @@ except ImportError:
 
 # Import application configuration from separate config module
 try:
-    from config import *
+    from route_planner.config import *
 except ImportError:
     # Fallback configuration if config.py is not available
     # These constants define the application's behavior and default settings
@@ -145,14 +232,27 @@ except ImportError:
 # LOGGING CONFIGURATION
 # =============================================================================
 
-# Configure logging for debugging and monitoring application behavior
+# Configure logging for debugging and monitoring application behavior.
+# Log calls only enqueue the record; a background listener thread does the
+# file and console writes so the GUI and worker threads never block on I/O.
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_file_handler = logging.FileHandler('route_planner.log')  # Log to file for persistence
+_log_file_handler.setFormatter(_log_formatter)
+_log_console_handler = logging.StreamHandler(sys.stdout)      # Also log to console for development
+_log_console_handler.setFormatter(_log_formatter)
+
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_log_queue_handler.setFormatter(logging.Formatter())  # Final formatting happens in the listener
+log_listener = logging.handlers.QueueListener(
+    _log_queue, _log_file_handler, _log_console_handler, respect_handler_level=True
+)
+log_listener.start()
+atexit.register(log_listener.stop)  # Flush queued records on shutdown
+
 logging.basicConfig(
     level=logging.INFO,      # Set logging level to INFO (change to DEBUG for detailed logs)
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Log message format
-    handlers=[
-        logging.FileHandler('route_planner.log'),  # Log to file for persistence
-        logging.StreamHandler(sys.stdout)          # Also log to console for development
-    ]
+    handlers=[_log_queue_handler]
 )
 logger = logging.getLogger(__name__)  # Create logger instance for this module
 
@@ -186,6 +286,165 @@ Design Philosophy:
 - Contextual help: Each step relates to specific functionality
 """
 
+# Dialog stylesheets, kept as module constants so the strings are built once.
+# Only properties in Qt's QSS subset are used (no line-height or transform).
+_WELCOME_QSS = """
+/* Font family for every widget in the dialog */
+QWidget {
+    font-family: 'Segoe UI', Arial, sans-serif;
+}
+
+/* Main dialog styling with dark theme */
+QDialog {
+    background-color: #2b2b2b;
+    color: white;
+}
+
+/* General label styling for readability */
+QLabel {
+    color: white;
+    font-size: 13px;
+}
+
+/* Main title styling with brand colors */
+QLabel#title {
+    font-size: 26px;
+    font-weight: bold;
+    color: #4CAF50;        /* Green accent color */
+    margin-bottom: 5px;
+}
+
+/* Subtitle styling for secondary emphasis */
+QLabel#subtitle {
+    font-size: 17px;
+    color: #81C784;        /* Lighter green for hierarchy */
+    margin-bottom: 10px;
+}
+
+/* Primary action button styling */
+QPushButton {
+    background-color: #4CAF50;
+    color: white;
+    border: none;
+    padding: 12px 24px;
+    border-radius: 6px;
+    font-size: 13px;
+    font-weight: bold;
+    min-width: 120px;
+}
+
+/* Button hover effects for better UX */
+QPushButton:hover {
+    background-color: #45a049;
+}
+
+/* Secondary button styling (Skip Tutorial) */
+QPushButton#skip {
+    background-color: #666;
+    color: #ccc;
+}
+
+/* Skip button hover effect */
+QPushButton#skip:hover {
+    background-color: #777;
+    color: white;
+}
+
+/* Button pressed states for tactile feedback */
+QPushButton:pressed {
+    background-color: #3d8b40;
+}
+"""
+
+# Overview shown in the middle of the welcome dialog
+_WELCOME_DESCRIPTION_HTML = """
+<div style="text-align: center; line-height: 1.4; font-size: 13px;">
+<p style="margin: 8px 0;"><b>What this app does:</b></p>
+<p style="margin: 4px 0;">📍 Plan optimal delivery routes for multiple stops</p>
+<p style="margin: 4px 0;">🗺️ Visualize routes on an interactive map</p>
+<p style="margin: 4px 0;">⚡ Choose between exact and fast approximation algorithms</p>
+<p style="margin: 4px 0;">📊 Compare different routing strategies</p>
+<br>
+<p style="margin: 8px 0;"><b>Perfect for:</b></p>
+<p style="margin: 4px 0;">• Delivery drivers and logistics coordinators</p>
+<p style="margin: 4px 0;">• Small business owners with delivery services</p>
+<p style="margin: 4px 0;">• Anyone needing to optimize multi-stop routes</p>
+</div>
+"""
+
+# Scoped to #TutorialDialog so it can be appended to the main window stylesheet
+_TUTORIAL_QSS = """
+QDialog#TutorialDialog {
+    background-color: #2b2b2b;
+    color: white;
+}
+#TutorialDialog QLabel#title {
+    font-size: 16px;
+    font-weight: bold;
+    color: #4CAF50;
+    margin-bottom: 10px;
+}
+#TutorialDialog QLabel#content {
+    font-size: 12px;
+    padding: 10px;
+}
+#TutorialDialog QPushButton {
+    background-color: #4CAF50;
+    color: white;
+    border: none;
+    padding: 8px 16px;
+    border-radius: 4px;
+    font-size: 11px;
+}
+#TutorialDialog QPushButton:hover {
+    background-color: #45a049;
+}
+#TutorialDialog QPushButton#skip {
+    background-color: #666;
+}
+#TutorialDialog QPushButton#skip:hover {
+    background-color: #777;
+}
+#TutorialDialog QLabel#progress {
+    border: 1px solid #666;
+    border-radius: 3px;
+    background-color: #333;
+    color: #4CAF50;
+    padding: 2px;
+}
+#TutorialDialog QScrollArea {
+    border: 1px solid #555;
+    border-radius: 4px;
+    background-color: #333;
+}
+#TutorialDialog QScrollBar:vertical {
+    background-color: #404040;
+    width: 16px;
+    border-radius: 8px;
+}
+#TutorialDialog QScrollBar::handle:vertical {
+    background-color: #666666;
+    border-radius: 8px;
+    min-height: 20px;
+}
+#TutorialDialog QScrollBar::handle:vertical:hover {
+    background-color: #4CAF50;
+}
+#TutorialDialog QScrollBar:horizontal {
+    background-color: #404040;
+    height: 16px;
+    border-radius: 8px;
+}
+#TutorialDialog QScrollBar::handle:horizontal {
+    background-color: #666666;
+    border-radius: 8px;
+    min-width: 20px;
+}
+#TutorialDialog QScrollBar::handle:horizontal:hover {
+    background-color: #4CAF50;
+}
+"""
+
 class WelcomeDialog(QtWidgets.QDialog):
     """
     Initial welcome dialog that introduces new users to the application.
@@ -225,76 +484,7 @@ class WelcomeDialog(QtWidgets.QDialog):
         self._setup_ui()
         
         # Apply modern dark theme styling
-        self._apply_welcome_styling()
-        
-    def _apply_welcome_styling(self):
-        """Apply comprehensive styling to create a modern, professional appearance."""
-        self.setStyleSheet("""
-            /* Main dialog styling with dark theme */
-            QDialog {
-                background-color: #2b2b2b;
-                color: white;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            
-            /* General label styling for readability */
-            QLabel {
-                color: white;
-                font-size: 13px;
-                line-height: 1.4;
-            }
-            
-            /* Main title styling with brand colors */
-            QLabel#title {
-                font-size: 26px;
-                font-weight: bold;
-                color: #4CAF50;        /* Green accent color */
-                margin-bottom: 5px;
-            }
-            
-            /* Subtitle styling for secondary emphasis */
-            QLabel#subtitle {
-                font-size: 17px;
-                color: #81C784;        /* Lighter green for hierarchy */
-                margin-bottom: 10px;
-            }
-            
-            /* Primary action button styling */
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 12px 24px;
-                border-radius: 6px;
-                font-size: 13px;
-                font-weight: bold;
-                min-width: 120px;
-            }
-            
-            /* Button hover effects for better UX */
-            QPushButton:hover {
-                background-color: #45a049;
-                transform: translateY(-1px);
-            }
-            
-            /* Secondary button styling (Skip Tutorial) */
-            QPushButton#skip {
-                background-color: #666;
-                color: #ccc;
-            }
-            
-            /* Skip button hover effect */
-            QPushButton#skip:hover {
-                background-color: #777;
-                color: white;
-            }
-            
-            /* Button pressed states for tactile feedback */
-            QPushButton:pressed {
-                background-color: #3d8b40;
-                transform: translateY(0px);
-            }
-        """)
+        self.setStyleSheet(_WELCOME_QSS)
         
     def _setup_ui(self):
         """
@@ -322,23 +512,15 @@ class WelcomeDialog(QtWidgets.QDialog):
         layout.addWidget(subtitle)
         
         # Description
-        description = QtWidgets.QLabel("""
-        <div style="text-align: center; line-height: 1.4; font-size: 13px;">
-        <p style="margin: 8px 0;"><b>What this app does:</b></p>
-        <p style="margin: 4px 0;">📍 Plan optimal delivery routes for multiple stops</p>
-        <p style="margin: 4px 0;">🗺️ Visualize routes on an interactive map</p>
-        <p style="margin: 4px 0;">⚡ Choose between exact and fast approximation algorithms</p>
-        <p style="margin: 4px 0;">📊 Compare different routing strategies</p>
-        <br>
-        <p style="margin: 8px 0;"><b>Perfect for:</b></p>
-        <p style="margin: 4px 0;">• Delivery drivers and logistics coordinators</p>
-        <p style="margin: 4px 0;">• Small business owners with delivery services</p>
-        <p style="margin: 4px 0;">• Anyone needing to optimize multi-stop routes</p>
-        </div>
-        """)
+        description = QtWidgets.QLabel()
+        description.setTextFormat(QtCore.Qt.TextFormat.RichText)  # Known HTML, skip detection
         description.setWordWrap(True)
-        description.setMinimumHeight(250)  # Ensure minimum height for content
+        # Fixed height: the dialog is fixed-size and the text is static, so layout
+        # activation need not run word-wrap reflow through minimumSizeHint()
+        description.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        description.setFixedHeight(250)
         description.setAlignment(QtCore.Qt.AlignmentFlag.AlignTop)  # Align content to top
+        description.setText(_WELCOME_DESCRIPTION_HTML)  # Set last so the label lays out once
         layout.addWidget(description)
         
         # Add some stretch to push buttons to bottom
@@ -361,6 +543,9 @@ class WelcomeDialog(QtWidgets.QDialog):
         
         layout.addLayout(button_layout)
 
+# Widget-local origin passed to mapTo() when locating highlighted widgets
+_ZERO_POINT = QtCore.QPoint(0, 0)
+
 class TutorialOverlay(QtWidgets.QWidget):
     """
     Semi-transparent overlay widget for highlighting UI elements during tutorials.
@@ -378,7 +563,7 @@ class TutorialOverlay(QtWidgets.QWidget):
     
     Attributes:
         highlight_rect (QtCore.QRect): Rectangle defining the highlighted area
-        highlight_widget (QtWidgets.QWidget): Currently highlighted widget reference
+        highlight_widget (tuple): Currently highlighted widget(s), or None
     """
     
     def __init__(self, parent=None):
@@ -393,15 +578,48 @@ class TutorialOverlay(QtWidgets.QWidget):
         # Configure window properties for overlay functionality
         self.setWindowFlags(QtCore.Qt.FramelessWindowHint)  # Remove window decorations
         self.setAttribute(QtCore.Qt.WA_TranslucentBackground)  # Enable transparency
-        self.setStyleSheet("background: transparent;")  # Transparent background
+        self.setAttribute(QtCore.Qt.WA_NoSystemBackground, True)  # paintEvent covers every pixel
+        self.setAttribute(QtCore.Qt.WA_OpaquePaintEvent, False)  # Not opaque: the fill has alpha
         
         # Initialize highlighting properties
         self.highlight_rect = QtCore.QRect()  # Rectangle for highlighted area
         self.highlight_widget = None  # Reference to highlighted widget
-        
-        # Ensure overlay covers the entire parent window
+        self._padded_rect = QtCore.QRect()  # Highlight plus padding, the cutout
+        self._glow_rect = QtCore.QRect()  # Padded rect grown by 1px for the glow
+        
+        # Paint resources, allocated once rather than in every paintEvent
+        self._overlay_color = QtGui.QColor(0, 0, 0, 150)  # Dark with 150/255 opacity
+        self._border_pen = QtGui.QPen(QtGui.QColor(76, 175, 80), 4)  # Green border, 4px width
+        self._glow_pen = QtGui.QPen(QtGui.QColor(76, 175, 80, 100), 6)  # Lighter green, 6px width
+        self._cache_pixmap = None  # Last rendered overlay frame
+        self._cache_key = None  # (width, height, padded rect) the frame was rendered for
+        
+        # Zero-delay single-shot timer that debounces resize-driven recomputation
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(0)
+        self._resize_timer.timeout.connect(self._recompute_highlight)
+        
+        # Ensure overlay covers the entire parent window, now and on every
+        # parent resize (child widgets do not follow their parent's size)
         if parent:
             self.setGeometry(parent.rect())
+            parent.installEventFilter(self)
+        
+    def eventFilter(self, obj, event):
+        """
+        Follow the parent window's size so the overlay keeps covering it.
+        
+        Args:
+            obj: The watched object (the parent window)
+            event: The event delivered to it
+            
+        Returns:
+            bool: Always False, so the parent still handles the event itself
+        """
+        if obj is self.parent() and event.type() == QEvent.Resize:
+            self.setGeometry(obj.rect())
+        return False
         
     def highlight_widget_area(self, widget):
         """
@@ -414,66 +632,99 @@ class TutorialOverlay(QtWidgets.QWidget):
         Args:
             widget (QtWidgets.QWidget or list): The widget(s) to highlight. If None, removes highlighting.
         """
-        # Clear existing highlight
-        self.highlight_rect = QtCore.QRect()
-        self.highlight_widget = None
-        
-        if widget and self.parent():
-            if isinstance(widget, list):
-                # Multiple widgets to highlight
-                self.highlight_widget = widget
-                # Calculate combined bounding box for all widgets
-                combined_rect = QtCore.QRect()
-                for w in widget:
-                    if w and w.isVisible():
-                        pos = w.mapTo(self.parent(), QtCore.QPoint(0, 0))
-                        widget_rect = QtCore.QRect(pos, w.size())
-                        if combined_rect.isEmpty():
-                            combined_rect = widget_rect
-                        else:
-                            combined_rect = combined_rect.united(widget_rect)
-                self.highlight_rect = combined_rect
-            else:
-                # Single widget to highlight
-                self.highlight_widget = widget
-                # Calculate widget position relative to the main window
-                pos = widget.mapTo(self.parent(), QtCore.QPoint(0, 0))
-                self.highlight_rect = QtCore.QRect(pos, widget.size())
+        # Normalize to a tuple so single and multiple widgets share one code path
+        if not widget:
+            widgets = None
+        elif isinstance(widget, (list, tuple)):
+            widgets = tuple(widget)
+        else:
+            widgets = (widget,)
+        
+        rect = self._compute_rect(widgets)
+        if widgets == self.highlight_widget and rect == self.highlight_rect:
+            return  # Same target as the previous step: nothing to repaint
+        
+        old_dirty = self._dirty_rect()
+        self.highlight_widget = widgets
+        self.highlight_rect = rect
+        self._update_padded_rects()
+        
+        # Repaint only the old and new highlight areas; the dark fill elsewhere is unchanged
+        self.update(old_dirty.united(self._dirty_rect()))
+        
+    def _dirty_rect(self):
+        """Return the area the current highlight paints over, or a null rect if none."""
+        if self.highlight_rect.isNull():
+            return QtCore.QRect()
+        return self._glow_rect.adjusted(-3, -3, 3, 3)  # Half of the 6px glow pen
         
-        # Trigger a repaint to update the visual overlay
-        self.update()
+    def _compute_rect(self, widgets):
+        """
+        Compute the bounding box of the given widgets in parent coordinates.
+        
+        Args:
+            widgets (tuple): Widgets to enclose; None and hidden entries are skipped
+            
+        Returns:
+            QtCore.QRect: The combined rectangle, or a null rect if nothing is visible
+        """
+        parent = self.parent()  # Looked up once, not per widget
+        if not widgets or not parent:
+            return QtCore.QRect()
+        
+        # Plain int min/max instead of a QRect plus united() per widget
+        left = top = sys.maxsize
+        right = bottom = -sys.maxsize
+        for w in widgets:
+            if w and w.isVisible():
+                pos = w.mapTo(parent, _ZERO_POINT)
+                x, y = pos.x(), pos.y()
+                left = min(left, x)
+                top = min(top, y)
+                right = max(right, x + w.width())
+                bottom = max(bottom, y + w.height())
+        if right < left:
+            return QtCore.QRect()  # Nothing visible to highlight
+        return QtCore.QRect(left, top, right - left, bottom - top)
+        
+    def _update_padded_rects(self):
+        """Recompute the cutout and glow rectangles after highlight_rect changes."""
+        # Padding gives better visual separation around the highlighted widget
+        self._padded_rect = self.highlight_rect.adjusted(-10, -10, 10, 10)
+        self._glow_rect = self._padded_rect.adjusted(-1, -1, 1, 1)
+        self._cache_key = None  # Highlight moved: re-render the cached frame
+        
+        # Cut the hole with a widget mask so its pixels are never painted; the
+        # mask keeps the inner half of the border pens (up to 3px inside)
+        if self.highlight_rect.isNull():
+            self.clearMask()
+        else:
+            hole = QtGui.QRegion(self._padded_rect.adjusted(3, 3, -3, -3))
+            self.setMask(QtGui.QRegion(self.rect()).subtracted(hole))
         
     def resizeEvent(self, event):
         """
         Handle resize events to maintain full window coverage.
         
         When the parent window is resized, this method ensures the overlay
-        continues to cover the entire window and recalculates the position
-        of any highlighted widget.
+        continues to cover the entire window and schedules a recalculation of
+        the highlighted widget's position once the resize burst settles.
         
         Args:
             event (QtGui.QResizeEvent): The resize event containing new dimensions
         """
         super().resizeEvent(event)
+        self._cache_key = None  # Size changed: re-render the cached frame
+        
+        # Coalesce resize ticks: only the last one in an event-loop pass recomputes
+        self._resize_timer.start()
         
+    def _recompute_highlight(self):
+        """Re-calculate the highlight position after the overlay was resized."""
         # Re-calculate highlight position if a widget is currently highlighted
-        if self.highlight_widget and self.parent():
-            if isinstance(self.highlight_widget, list):
-                # Multiple widgets to highlight
-                combined_rect = QtCore.QRect()
-                for w in self.highlight_widget:
-                    if w and w.isVisible():
-                        pos = w.mapTo(self.parent(), QtCore.QPoint(0, 0))
-                        widget_rect = QtCore.QRect(pos, w.size())
-                        if combined_rect.isEmpty():
-                            combined_rect = widget_rect
-                        else:
-                            combined_rect = combined_rect.united(widget_rect)
-                self.highlight_rect = combined_rect
-            else:
-                # Single widget highlighting
-                pos = self.highlight_widget.mapTo(self.parent(), QtCore.QPoint(0, 0))
-                self.highlight_rect = QtCore.QRect(pos, self.highlight_widget.size())
+        if self.highlight_widget:
+            self.highlight_rect = self._compute_rect(self.highlight_widget)
+            self._update_padded_rects()
             self.update()  # Trigger repaint with new dimensions
         
     def paintEvent(self, event):
@@ -486,63 +737,50 @@ class TutorialOverlay(QtWidgets.QWidget):
         3. Drawing a colored border around the highlighted area
         4. Adding visual effects like glowing borders
         
-        The painting algorithm divides the overlay into four rectangles around
-        the highlighted area to create the cutout effect.
+        The cutout is a widget mask (set when the highlight changes) that
+        excludes the padded highlight rectangle, so the hole is never painted.
+        The rendered frame is cached in a pixmap, so repaints with an unchanged
+        size and highlight (e.g. while a step is being read) are a single blit.
         
         Args:
             event: QPaintEvent containing information about the area to paint
         """
+        key = (self.width(), self.height(), self._padded_rect.getRect())
+        if key != self._cache_key:
+            ratio = self.devicePixelRatioF()
+            pixmap = QtGui.QPixmap(self.size() * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(QtCore.Qt.transparent)
+            pixmap_painter = QtGui.QPainter(pixmap)
+            self._render_overlay(pixmap_painter)
+            pixmap_painter.end()
+            self._cache_pixmap = pixmap
+            self._cache_key = key
+        
         painter = QtGui.QPainter(self)
+        painter.drawPixmap(0, 0, self._cache_pixmap)
+        
+    def _render_overlay(self, painter):
+        """
+        Draw the dark overlay, cutout and highlight borders with the given painter.
+        
+        Args:
+            painter (QtGui.QPainter): Painter targeting the overlay-sized pixmap
+        """
         painter.setRenderHint(QtGui.QPainter.Antialiasing)  # Smooth rendering
         
-        # Define the semi-transparent overlay color (dark with 150/255 opacity)
-        overlay_color = QtGui.QColor(0, 0, 0, 150)
+        # Dark fill everywhere; the widget mask keeps it out of the highlight hole
+        painter.fillRect(self.rect(), self._overlay_color)
         
         if not self.highlight_rect.isNull():
-            # Create a padded highlight area for better visual separation
-            padded_rect = self.highlight_rect.adjusted(-10, -10, 10, 10)
+            # Draw a colored border around the highlighted area
+            painter.setPen(self._border_pen)
+            painter.setBrush(QtCore.Qt.NoBrush)  # No fill, just border
+            painter.drawRect(self._padded_rect)
             
-            # Draw four rectangles around the highlight area to create cutout effect
-            try:
-                # Top rectangle (covers area above the highlighted widget)
-                if padded_rect.top() > 0:
-                    top_rect = QtCore.QRect(0, 0, self.width(), padded_rect.top())
-                    painter.fillRect(top_rect, overlay_color)
-                
-                # Bottom rectangle (covers area below the highlighted widget)
-                if padded_rect.bottom() < self.height():
-                    bottom_rect = QtCore.QRect(0, padded_rect.bottom(), 
-                                             self.width(), self.height() - padded_rect.bottom())
-                    painter.fillRect(bottom_rect, overlay_color)
-                
-                # Left rectangle (covers area to the left of highlighted widget)
-                if padded_rect.left() > 0:
-                    left_rect = QtCore.QRect(0, padded_rect.top(), 
-                                           padded_rect.left(), padded_rect.height())
-                    painter.fillRect(left_rect, overlay_color)
-                
-                # Right rectangle (covers area to the right of highlighted widget)
-                if padded_rect.right() < self.width():
-                    right_rect = QtCore.QRect(padded_rect.right(), padded_rect.top(), 
-                                            self.width() - padded_rect.right(), padded_rect.height())
-                    painter.fillRect(right_rect, overlay_color)
-                
-                # Draw a colored border around the highlighted area
-                painter.setPen(QtGui.QPen(QtGui.QColor(76, 175, 80), 4))  # Green border, 4px width
-                painter.setBrush(QtCore.Qt.NoBrush)  # No fill, just border
-                painter.drawRect(padded_rect)
-                
-                # Add an outer glow effect for better visibility
-                painter.setPen(QtGui.QPen(QtGui.QColor(76, 175, 80, 100), 6))  # Lighter green, 6px width
-                painter.drawRect(padded_rect.adjusted(-1, -1, 1, 1))  # Slightly larger rectangle
-                
-            except Exception as e:
-                # Fallback: fill entire overlay if rectangle calculations fail
-                painter.fillRect(self.rect(), overlay_color)
-            
-        else:
-            # No highlight area specified, create full dark overlay
-            painter.fillRect(self.rect(), overlay_color)
+            # Add an outer glow effect for better visibility
+            painter.setPen(self._glow_pen)
+            painter.drawRect(self._glow_rect)
 
 class TutorialDialog(QtWidgets.QDialog):
     """
@@ -566,13 +804,17 @@ class TutorialDialog(QtWidgets.QDialog):
         skip_btn (QPushButton): Button to skip the entire tutorial
     """
     
+    # Navigation requests; Skip uses the dialog's own rejected() signal
+    back_requested = QtCore.pyqtSignal()
+    next_requested = QtCore.pyqtSignal()
+    
     def __init__(self, title, content, step, total_steps, parent=None):
         """
         Initialize the tutorial dialog with content and navigation.
         
         Args:
             title (str): Title text for the tutorial step
-            content (str): Main content text (can include HTML formatting)
+            content (str): Main content text (plain text, line breaks are kept)
             step (int): Current step number (1-indexed)
             total_steps (int): Total number of tutorial steps
             parent: Parent widget (typically the main window)
@@ -580,80 +822,75 @@ class TutorialDialog(QtWidgets.QDialog):
         super().__init__(parent)
         
         # Configure dialog window properties
-        self.setWindowTitle(f"Tutorial - Step {step} of {total_steps}")
         self.resize(600, 500)  # Generous size for content readability
         self.setMinimumSize(500, 400)  # Ensure minimum usable size
         self.setWindowFlags(QtCore.Qt.WindowType.WindowStaysOnTopHint)  # Stay above main window
+        self.setModal(True)  # Shown with show(), so modality must be set explicitly
         
-        # Store step information for navigation logic
-        self.step = step
-        self.total_steps = total_steps
-        
-        # Initialize UI components and styling
-        self._setup_ui(title, content)
-        self._apply_styling()
+        # Initialize UI components; styling comes from _TUTORIAL_QSS, installed
+        # once on the main window by TutorialManager and matched by object name
+        self.setObjectName("TutorialDialog")
+        self._setup_ui()
+        self.set_step(title, content, step, total_steps)
         
-    def _setup_ui(self, title, content):
+    def _setup_ui(self):
         """
         Set up the tutorial dialog user interface components.
         
         This method creates a comprehensive layout including:
-        - Progress bar showing tutorial advancement
+        - Step indicator showing tutorial advancement
         - Title label with step-specific heading
         - Scrollable content area for tutorial text
-        - Navigation buttons adapted to current step position
-        
-        The layout is designed to handle varying content lengths and provides
-        smooth navigation through the tutorial sequence.
+        - Navigation buttons (Previous, Skip, Next/Finish)
         
-        Args:
-            title (str): Title text for the current tutorial step
-            content (str): Main tutorial content (supports HTML formatting)
+        The widgets are built once and filled in by set_step(), so the same
+        dialog is reused for every step of the tutorial.
         """
         layout = QtWidgets.QVBoxLayout(self)
         
-        # Progress bar to show tutorial advancement
-        progress = QtWidgets.QProgressBar()
-        progress.setMaximum(self.total_steps)
-        progress.setValue(self.step)
-        progress.setFormat(f"Step {self.step} of {self.total_steps}")
-        layout.addWidget(progress)
+        # Text step indicator (a plain label is much lighter than a QProgressBar)
+        self.progress_label = QtWidgets.QLabel()
+        self.progress_label.setObjectName("progress")  # For CSS styling
+        self.progress_label.setTextFormat(QtCore.Qt.TextFormat.PlainText)
+        self.progress_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.progress_label)
         
         # Title label with step-specific heading
-        title_label = QtWidgets.QLabel(title)
-        title_label.setObjectName("title")  # For CSS styling
-        title_label.setWordWrap(True)  # Handle long titles gracefully
-        layout.addWidget(title_label)
+        self.title_label = QtWidgets.QLabel()
+        self.title_label.setObjectName("title")  # For CSS styling
+        self.title_label.setTextFormat(QtCore.Qt.TextFormat.PlainText)  # Skip rich-text detection
+        self.title_label.setWordWrap(True)  # Handle long titles gracefully
+        layout.addWidget(self.title_label)
         
         # Scrollable content area for tutorial text
-        scroll_area = QtWidgets.QScrollArea()
-        scroll_area.setWidgetResizable(True)  # Allow content to resize
-        scroll_area.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.scroll_area = QtWidgets.QScrollArea()
+        self.scroll_area.setWidgetResizable(True)  # Allow content to resize
+        self.scroll_area.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.scroll_area.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         
         # Content widget inside scroll area
         content_widget = QtWidgets.QWidget()
         content_layout = QtWidgets.QVBoxLayout(content_widget)
         
-        # Main content label supporting HTML formatting
-        content_label = QtWidgets.QLabel(content)
-        content_label.setWordWrap(True)  # Handle long content lines
-        content_label.setObjectName("content")  # For CSS styling
-        content_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignTop)  # Top-align content
-        content_layout.addWidget(content_label)
+        # Main content label; plain text so the step's line breaks are kept
+        self.content_label = QtWidgets.QLabel()
+        self.content_label.setObjectName("content")  # For CSS styling
+        self.content_label.setTextFormat(QtCore.Qt.TextFormat.PlainText)  # Skip rich-text detection
+        self.content_label.setWordWrap(True)  # Handle long content lines
+        self.content_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignTop)  # Top-align content
+        content_layout.addWidget(self.content_label)
         content_layout.addStretch()  # Push content to top
         
-        scroll_area.setWidget(content_widget)
-        layout.addWidget(scroll_area, 1)  # Give scroll area maximum space
+        self.scroll_area.setWidget(content_widget)
+        layout.addWidget(self.scroll_area, 1)  # Give scroll area maximum space
         
-        # Navigation buttons adapted to current step
+        # Navigation buttons; visibility and labels are updated per step
         button_layout = QtWidgets.QHBoxLayout()
         
-        # Previous button (only show if not on first step)
-        if self.step > 1:
-            self.back_btn = QtWidgets.QPushButton("← Previous")
-            self.back_btn.clicked.connect(lambda: self.done(-1))  # Signal to go back
-            button_layout.addWidget(self.back_btn)
+        # Previous button (hidden on the first step)
+        self.back_btn = QtWidgets.QPushButton("← Previous")
+        self.back_btn.clicked.connect(self._go_back)  # Signal to go back
+        button_layout.addWidget(self.back_btn)
         
         # Skip tutorial button (always available)
         self.skip_btn = QtWidgets.QPushButton("Skip Tutorial")
@@ -664,93 +901,102 @@ class TutorialDialog(QtWidgets.QDialog):
         button_layout.addStretch()  # Push Next/Finish button to the right
         
         # Next/Finish button (text changes based on step position)
-        if self.step < self.total_steps:
-            self.next_btn = QtWidgets.QPushButton("Next →")
-            self.next_btn.clicked.connect(self.accept)  # Signal to proceed
-        else:
-            self.next_btn = QtWidgets.QPushButton("Finish Tutorial")
-            self.next_btn.clicked.connect(self.accept)  # Signal tutorial completion
-        
+        self.next_btn = QtWidgets.QPushButton()
+        self.next_btn.clicked.connect(self.next_requested)  # Signal to proceed
         button_layout.addWidget(self.next_btn)
         layout.addLayout(button_layout)
         
-    def _apply_styling(self):
-        """Apply styling to the tutorial dialog."""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-                color: white;
-            }
-            QLabel#title {
-                font-size: 16px;
-                font-weight: bold;
-                color: #4CAF50;
-                margin-bottom: 10px;
-            }
-            QLabel#content {
-                font-size: 12px;
-                line-height: 1.4;
-                padding: 10px;
-            }
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton#skip {
-                background-color: #666;
-            }
-            QPushButton#skip:hover {
-                background-color: #777;
-            }
-            QProgressBar {
-                border: 1px solid #666;
-                border-radius: 3px;
-                background-color: #333;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #4CAF50;
-                border-radius: 2px;
-            }
-            QScrollArea {
-                border: 1px solid #555;
-                border-radius: 4px;
-                background-color: #333;
-            }
-            QScrollBar:vertical {
-                background-color: #404040;
-                width: 16px;
-                border-radius: 8px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #666666;
-                border-radius: 8px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #4CAF50;
-            }
-            QScrollBar:horizontal {
-                background-color: #404040;
-                height: 16px;
-                border-radius: 8px;
-            }
-            QScrollBar::handle:horizontal {
-                background-color: #666666;
-                border-radius: 8px;
-                min-width: 20px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background-color: #4CAF50;
-            }
-        """)
+    def set_step(self, title, content, step, total_steps):
+        """
+        Fill the dialog with the content of a tutorial step.
+        
+        Args:
+            title (str): Title text for the tutorial step
+            content (str): Main content text (plain text, line breaks are kept)
+            step (int): Current step number (1-indexed)
+            total_steps (int): Total number of tutorial steps
+        """
+        self.step = step
+        self.total_steps = total_steps
+        
+        self.setWindowTitle(f"Tutorial - Step {step} of {total_steps}")
+        bar = "█" * step + "░" * (total_steps - step)
+        self.progress_label.setText(f"Step {step} of {total_steps}   {bar}")
+        self.title_label.setText(title)
+        self.content_label.setText(content)
+        self.scroll_area.verticalScrollBar().setValue(0)  # New step starts at the top
+        
+        self.back_btn.setVisible(step > 1)
+        self.next_btn.setText("Next →" if step < total_steps else "Finish Tutorial")
+        
+    def _go_back(self):
+        """Ask TutorialManager to show the previous step."""
+        self.back_requested.emit()
+        
+class TutorialStep(NamedTuple):
+    """
+    One tutorial step: dialog title and text plus what to highlight.
+    
+    In _TUTORIAL_STEPS, highlight holds PlannerUI attribute name(s); the copies
+    bound by TutorialManager hold the resolved widget(s) instead.
+    """
+    title: str
+    content: str
+    highlight: Any
+
+# Tutorial steps covering all major features, shared by every TutorialManager
+_TUTORIAL_STEPS = (
+    TutorialStep(
+        title="Welcome to the Interface",
+        content="This is the main interface of the Route Planner. On the left, you'll see the control panel with all the settings. On the right is the interactive map where your routes will be displayed.",
+        highlight="panel"  # Highlight the control panel
+    ),
+    TutorialStep(
+        title="Headquarters Location",
+        content="This shows your headquarters (HQ) location. All delivery routes will start and end here. The coordinates can be changed in the config file to match your business location.",
+        highlight="hq_label"  # Highlight HQ display
+    ),
+    TutorialStep(
+        title="Number of Delivery Stops",
+        content="Here you can see and edit the number of delivery stops. Click 'Edit Stops' to change this number. More stops mean more complex route optimization.",
+        highlight="stops_display"  # Highlight stops counter
+    ),
+    TutorialStep(
+        title="Delivery Locations Table",
+        content="This table shows all your delivery locations with their coordinates (latitude and longitude). You can edit these coordinates directly in the table, or add/remove stops using the buttons below.",
+        highlight="table"  # Highlight data table
+    ),
+    TutorialStep(
+        title="Adding and Removing Stops",
+        content="Use these buttons to add new delivery stops or remove existing ones. New stops are automatically generated with random coordinates near your HQ.",
+        highlight=("add_btn", "remove_btn")  # Highlight both add and remove buttons
+    ),
+    TutorialStep(
+        title="Algorithm Selection",
+        content="Choose your optimization algorithm:\n• Auto: Smart selection based on problem size\n• Held-Karp: Exact optimal solution (slower for many stops)\n• Christofides: Fast approximation (good for many stops)",
+        highlight="algo_combo"  # Highlight algorithm selector
+    ),
+    TutorialStep(
+        title="Planning Your Route",
+        content="Click this button to start route optimization. The app will find the best route visiting all delivery locations and return to HQ. Progress will be shown during calculation.",
+        highlight="plan_btn"  # Highlight plan button
+    ),
+    TutorialStep(
+        title="Comparing Algorithms",
+        content="This button runs both algorithms and compares their results. You'll see the trade-off between solution quality and computation time. Great for understanding algorithm performance!",
+        highlight="compare_btn"  # Highlight compare button
+    ),
+    TutorialStep(
+        title="Results and Output",
+        content="All results, timing information, and route details appear here. You'll see total distance, computation time, and the order of stops in your optimized route.",
+        highlight="out"  # Highlight output area
+    ),
+    TutorialStep(
+        title="Interactive Map",
+        content="The map shows your HQ (green), delivery stops (red), and optimized routes. You can zoom and pan to explore the area. Different algorithms show routes in different colors.",
+        highlight="map_view"  # Highlight map widget
+    ),
+)
 
 class TutorialManager:
     """
@@ -778,7 +1024,7 @@ class TutorialManager:
         overlay (TutorialOverlay): Visual overlay for highlighting UI elements
         current_step (int): Current step index in the tutorial sequence
         tutorial_active (bool): Flag indicating if tutorial is currently running
-        tutorial_steps (list): Comprehensive list of tutorial step configurations
+        tutorial_steps (tuple): Shared TutorialStep definitions
     """
     
     def __init__(self, main_window):
@@ -789,73 +1035,56 @@ class TutorialManager:
             main_window: The main application window (PlannerUI instance)
         """
         self.main_window = main_window
-        self.overlay = None  # Will be created when tutorial starts
         self.current_step = 0  # Current step index (0-based)
         self.tutorial_active = False  # Tutorial state flag
+        self._dialog = None  # Shared step dialog, created on first start_tutorial()
+        self._screen_rect = QtCore.QRect()  # Primary screen geometry, read by start_tutorial()
         
-        # Comprehensive tutorial steps configuration covering all major features
-        self.tutorial_steps = [
-            {
-                "title": "Welcome to the Interface",
-                "content": "This is the main interface of the Route Planner. On the left, you'll see the control panel with all the settings. On the right is the interactive map where your routes will be displayed.",
-                "highlight_widget": "panel"  # Highlight the control panel
-            },
-            {
-                "title": "Headquarters Location",
-                "content": "This shows your headquarters (HQ) location. All delivery routes will start and end here. The coordinates can be changed in the config file to match your business location.",
-                "highlight_widget": "hq_label"  # Highlight HQ display
-            },
-            {
-                "title": "Number of Delivery Stops",
-                "content": "Here you can see and edit the number of delivery stops. Click 'Edit Stops' to change this number. More stops mean more complex route optimization.",
-                "highlight_widget": "stops_display"  # Highlight stops counter
-            },
-            {
-                "title": "Delivery Locations Table",
-                "content": "This table shows all your delivery locations with their coordinates (latitude and longitude). You can edit these coordinates directly in the table, or add/remove stops using the buttons below.",
-                "highlight_widget": "table"  # Highlight data table
-            },
-            {
-                "title": "Adding and Removing Stops",
-                "content": "Use these buttons to add new delivery stops or remove existing ones. New stops are automatically generated with random coordinates near your HQ.",
-                "highlight_widget": ["add_btn", "remove_btn"]  # Highlight both add and remove buttons
-            },
-            {
-                "title": "Algorithm Selection",
-                "content": "Choose your optimization algorithm:\n• Auto: Smart selection based on problem size\n• Held-Karp: Exact optimal solution (slower for many stops)\n• Christofides: Fast approximation (good for many stops)",
-                "highlight_widget": "algo_combo"  # Highlight algorithm selector
-            },
-            {
-                "title": "Planning Your Route",
-                "content": "Click this button to start route optimization. The app will find the best route visiting all delivery locations and return to HQ. Progress will be shown during calculation.",
-                "highlight_widget": "plan_btn"  # Highlight plan button
-            },
-            {
-                "title": "Comparing Algorithms",
-                "content": "This button runs both algorithms and compares their results. You'll see the trade-off between solution quality and computation time. Great for understanding algorithm performance!",
-                "highlight_widget": "compare_btn"  # Highlight compare button
-            },
-            {
-                "title": "Results and Output",
-                "content": "All results, timing information, and route details appear here. You'll see total distance, computation time, and the order of stops in your optimized route.",
-                "highlight_widget": "out"  # Highlight output area
-            },
-            {
-                "title": "Interactive Map",
-                "content": "The map shows your HQ (green), delivery stops (red), and optimized routes. You can zoom and pan to explore the area. Different algorithms show routes in different colors.",
-                "highlight_widget": "map_view"  # Highlight map widget
-            }
-        ]
+        # Visual overlay, built once and shown/hidden for each tutorial run
+        self.overlay = TutorialOverlay(main_window)
+        self.overlay.hide()
+        
+        # Parse the tutorial dialog stylesheet once for the window's lifetime
+        # instead of once per TutorialDialog (one dialog per step)
+        main_window.setStyleSheet(main_window.styleSheet() + _TUTORIAL_QSS)
+        
+        # Static step content is shared at module level; only widgets are bound per window
+        self.tutorial_steps = _TUTORIAL_STEPS
+        
+        # Resolve the widget names once; steps then use the widgets directly
+        self._bound_steps = self._bind_widget_refs()
+        
+    def _bind_widget_refs(self):
+        """
+        Resolve each step's highlight name(s) to main window widgets.
+        
+        Returns:
+            list: One TutorialStep per tutorial step whose highlight is a widget,
+            a list of widgets, or None when the step highlights nothing or its
+            widgets are missing
+        """
+        bound = []
+        for step in self.tutorial_steps:
+            widget_names = step.highlight
+            if isinstance(widget_names, (list, tuple)):
+                widgets = [getattr(self.main_window, name) for name in widget_names
+                           if hasattr(self.main_window, name)]
+                widget = widgets or None
+            elif widget_names:
+                widget = getattr(self.main_window, widget_names, None)
+            else:
+                widget = None
+            bound.append(step._replace(highlight=widget))
+        return bound
         
     def start_tutorial(self):
         """
         Start the interactive tutorial system.
         
         This method initiates the complete tutorial experience by:
-        1. Setting up the visual overlay system
-        2. Initializing tutorial state tracking
-        3. Creating and positioning the overlay
-        4. Beginning the first tutorial step
+        1. Initializing tutorial state tracking
+        2. Positioning and showing the overlay
+        3. Beginning the first tutorial step
         
         The tutorial provides guided introduction to all major features
         with contextual highlighting and step-by-step explanations.
@@ -863,12 +1092,20 @@ class TutorialManager:
         self.tutorial_active = True
         self.current_step = 0
         
-        # Create visual overlay for highlighting UI elements
-        self.overlay = TutorialOverlay(self.main_window)
-        self.overlay.setGeometry(self.main_window.rect())
+        # The screen does not change between steps; query it once per run
+        self._screen_rect = QtWidgets.QApplication.primaryScreen().geometry()
+        
+        # Show the visual overlay; it tracks the window size by itself
         self.overlay.show()
         self.overlay.raise_()  # Bring overlay to front for visibility
         
+        # One dialog serves every step; it is refilled rather than rebuilt
+        if self._dialog is None:
+            self._dialog = TutorialDialog("", "", 1, len(self.tutorial_steps), self.main_window)
+            self._dialog.next_requested.connect(self._next_step)
+            self._dialog.back_requested.connect(self._previous_step)
+            self._dialog.rejected.connect(self._finish_tutorial)  # Skip, Esc or close
+        
         # Begin with the first tutorial step
         self._show_tutorial_step()
         
@@ -879,11 +1116,10 @@ class TutorialManager:
         This method handles the presentation of individual tutorial steps by:
         1. Checking if more steps remain in the sequence
         2. Highlighting the relevant UI widget for the current step
-        3. Creating and positioning the tutorial dialog
-        4. Managing user navigation choices (Next, Previous, Skip)
+        3. Refilling and positioning the shared tutorial dialog
         
-        The method automatically progresses through steps or finishes
-        the tutorial based on user interaction.
+        The call returns immediately; the dialog's Next/Previous signals
+        and its rejected() signal (Skip) drive the following steps.
         """
         # Check if we've completed all tutorial steps
         if self.current_step >= len(self.tutorial_steps):
@@ -891,60 +1127,37 @@ class TutorialManager:
             return
             
         # Get configuration for current step
-        step_info = self.tutorial_steps[self.current_step]
+        step = self._bound_steps[self.current_step]
         
-        # Highlight the relevant UI widget(s) for this step
-        widget_names = step_info.get("highlight_widget")
+        # Highlight the relevant UI widget(s) for this step (None clears it)
+        self.overlay.highlight_widget_area(step.highlight)
         
-        # Clear any previous highlighting
-        self.overlay.highlight_widget_area(None)
-        
-        # Handle multiple widget highlighting or single widget
-        if widget_names:
-            if isinstance(widget_names, list):
-                # Multiple widgets to highlight
-                widgets_to_highlight = []
-                for name in widget_names:
-                    if hasattr(self.main_window, name):
-                        widget = getattr(self.main_window, name)
-                        widgets_to_highlight.append(widget)
-                
-                if widgets_to_highlight:
-                    # Only highlight if we found widgets to highlight
-                    self.overlay.highlight_widget_area(widgets_to_highlight)
-            else:
-                # Single widget highlighting
-                if hasattr(self.main_window, widget_names):
-                    widget = getattr(self.main_window, widget_names)
-                    self.overlay.highlight_widget_area(widget)
-        
-        # Create and configure tutorial dialog for this step
-        dialog = TutorialDialog(
-            step_info["title"],
-            step_info["content"],
+        # Fill the shared tutorial dialog with this step's content
+        dialog = self._dialog
+        dialog.set_step(
+            step.title,
+            step.content,
             self.current_step + 1,  # Convert to 1-based numbering for display
-            len(self.tutorial_steps),
-            self.main_window
+            len(self.tutorial_steps)
         )
         
         # Position dialog optimally to avoid blocking highlighted content
         self._position_tutorial_dialog(dialog)
         
-        # Show dialog and handle user response
-        result = dialog.exec_()
-        
-        if result == QtWidgets.QDialog.DialogCode.Accepted:
-            # User clicked Next/Finish - proceed to next step
-            self.current_step += 1
-            self._show_tutorial_step()
-        elif result == -1:  # Previous button clicked
-            # Go back to previous step (with bounds checking)
-            self.current_step = max(0, self.current_step - 1)
-            self._show_tutorial_step()
-        else:  # Skip/Cancel button clicked
-            # User wants to exit tutorial
-            self._finish_tutorial()
-            
+        # Show the dialog; navigation arrives through its signals
+        dialog.show()
+        dialog.raise_()
+        
+    def _next_step(self):
+        """Advance to the next tutorial step, finishing after the last one."""
+        self.current_step += 1
+        self._show_tutorial_step()
+        
+    def _previous_step(self):
+        """Go back one tutorial step (with bounds checking)."""
+        self.current_step = max(0, self.current_step - 1)
+        self._show_tutorial_step()
+        
     def _position_tutorial_dialog(self, dialog):
         """
         Position the tutorial dialog optimally to avoid blocking content.
@@ -966,8 +1179,8 @@ class TutorialManager:
         x = main_rect.x() + main_rect.width() - dialog_size.width() - 50
         y = main_rect.y() + (main_rect.height() - dialog_size.height()) // 2
         
-        # Ensure dialog stays within screen boundaries
-        screen = QtWidgets.QApplication.primaryScreen().geometry()
+        # Ensure dialog stays within screen boundaries (cached by start_tutorial)
+        screen = self._screen_rect
         x = max(0, min(x, screen.width() - dialog_size.width()))
         y = max(0, min(y, screen.height() - dialog_size.height()))
         
@@ -980,21 +1193,20 @@ class TutorialManager:
         
         This method handles tutorial completion by:
         1. Deactivating tutorial state
-        2. Hiding and cleaning up the visual overlay
-        3. Releasing overlay resources
-        4. Saving tutorial completion status to settings
+        2. Hiding the dialog, clearing the highlight and hiding the overlay
+        3. Saving tutorial completion status to settings
         
-        The cleanup ensures no memory leaks and proper resource management
-        while preserving the user's tutorial completion status for future runs.
+        The dialog and overlay are kept for reuse by the next tutorial run, and the
+        user's tutorial completion status is preserved for future launches.
         """
         # Deactivate tutorial state
         self.tutorial_active = False
         
-        # Clean up visual overlay
-        if self.overlay:
-            self.overlay.hide()  # Hide overlay immediately
-            self.overlay.deleteLater()  # Schedule for deletion
-            self.overlay = None  # Clear reference
+        # Hide the dialog and visual overlay; both are kept for the next tutorial run
+        if self._dialog is not None:
+            self._dialog.hide()
+        self.overlay.highlight_widget_area(None)
+        self.overlay.hide()
         
         # Save tutorial completion status for future runs
         self._mark_tutorial_completed()
@@ -1008,39 +1220,65 @@ class TutorialManager:
         from being shown again on subsequent application launches.
         
         The settings file uses JSON format for easy reading and modification.
-        If file operations fail, the error is logged but doesn't interrupt
+        The file is only rewritten when the flag is not already set. If file
+        operations fail, the error is logged but doesn't interrupt
         the application flow.
         """
         try:
-            from pathlib import Path
-            settings_file = Path("settings.json")
-            settings = {}
+            settings = _load_settings()
             
-            # Load existing settings if file exists
-            if settings_file.exists():
-                import json
-                with open(settings_file, 'r') as f:
-                    settings = json.load(f)
+            # Nothing to write if the flag is already persisted
+            if settings.get('tutorial_completed') is True:
+                return
             
-            # Mark tutorial as completed
-            settings['tutorial_completed'] = True
-            
-            # Save updated settings
-            with open(settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+            # Mark tutorial as completed and save updated settings
+            _save_settings({**settings, 'tutorial_completed': True})
                 
         except Exception as e:
             # Log warning but don't crash application
             logger.warning(f"Could not save tutorial completion status: {e}")
 
 
+# Persistent user settings (tutorial state); parsed once per process
+SETTINGS_FILE = Path("settings.json")
+_SETTINGS_CACHE: Optional[Dict[str, Any]] = None
+
+def _load_settings() -> Dict[str, Any]:
+    """
+    Return the parsed settings file, reading it from disk only on first use.
+    
+    Returns:
+        dict: Settings (empty when the file is missing or empty); treat as read-only
+        
+    Raises:
+        OSError: If the file exists but cannot be read
+        ValueError: If the file is not valid JSON
+    """
+    global _SETTINGS_CACHE
+    if _SETTINGS_CACHE is None:
+        # One read instead of exists() + stat() + read; a missing file is just empty
+        try:
+            data = SETTINGS_FILE.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            data = ""
+        _SETTINGS_CACHE = json.loads(data) if data.strip() else {}
+    return _SETTINGS_CACHE
+
+def _save_settings(settings: Dict[str, Any]) -> None:
+    """Write settings to disk and, once written, make them the cached copy."""
+    global _SETTINGS_CACHE
+    SETTINGS_FILE.write_text(json.dumps(settings, indent=2), encoding="utf-8")
+    _SETTINGS_CACHE = settings
+
 def check_first_run():
     """
     Check if this is the user's first run of the application.
     
     This function examines the settings.json file to determine whether
     the user has previously completed the tutorial. It's used to decide
-    whether to show the welcome dialog and tutorial on startup.
+    whether to show the welcome dialog and tutorial on startup. The parsed
+    settings are cached, so marking the tutorial completed later in the
+    session does not parse the file again.
     
     Returns:
         bool: True if this appears to be the first run (no completed tutorial),
@@ -1051,21 +1289,9 @@ def check_first_run():
         assumes this is a first run to ensure new users see the tutorial.
     """
     try:
-        from pathlib import Path
-        import json
+        return not _load_settings().get('tutorial_completed', False)
         
-        # Check if settings file exists
-        settings_file = Path("settings.json")
-        if not settings_file.exists() or settings_file.stat().st_size == 0:
-            return True  # No settings file or empty file means first run
-            
-        # Read settings and check tutorial status
-        with open(settings_file, 'r') as f:
-            settings = json.load(f)
-            
-        return not settings.get('tutorial_completed', False)
-        
-    except (Exception, json.JSONDecodeError) as e:
+    except Exception as e:
         # If we can't read settings, assume first run for safety
         logger.warning(f"Error reading settings file, assuming first run: {e}")
         return True
@@ -1142,18 +1368,16 @@ def load_config():
     
     # Attempt to load custom configuration from external config.py file
     try:
-        import config as config_module
+        from route_planner import config as config_module
         logger.debug("Found config.py file, loading custom configuration")
         
-        # Override defaults with values from config.py
-        for key in config.keys():
-            if hasattr(config_module, key):
-                custom_value = getattr(config_module, key)
-                config[key] = custom_value
-                logger.debug(f"Loaded custom setting: {key} = {custom_value}")
+        # Override defaults with values from config.py (one pass over the module dict)
+        overrides = {key: value for key, value in vars(config_module).items() if key in config}
+        config.update(overrides)
+        logger.debug(f"Loaded custom settings: {overrides}")
                 
         # Special handling for string-based log levels (convert to logging constants)
-        if isinstance(config["LOG_LEVEL"], str):
+        if "LOG_LEVEL" in overrides and isinstance(config["LOG_LEVEL"], str):
             config["LOG_LEVEL"] = getattr(logging, config["LOG_LEVEL"].upper())
             
         print("✓ Configuration loaded from config.py")
@@ -1207,9 +1431,6 @@ if not CACHE_DIR.exists():
         logger.error(f"Failed to create cache directory: {e}")
         logger.error(f"Failed to create cache directory: {e}")
 
-# Environment setup
-os.environ.setdefault("QTWEBENGINE_DISABLE_SANDBOX", "1")  # Required for QtWebEngine
-
 # -----------------------------------------------------------------------------
 #  LOGGING SETUP
 # -----------------------------------------------------------------------------
@@ -1305,9 +1526,8 @@ of the route planning application. Key components include:
    - Intelligent cache key generation based on function parameters
 
 2. GRAPH SERIALIZATION:
-   - Conversion of NetworkX graphs to JSON-serializable formats
-   - Preservation of complex geometric data (Shapely objects)
-   - Bidirectional conversion maintaining data integrity
+   - Road network graphs cached as pickles (optionally zstd-compressed)
+   - Shapely geometries and graph types preserved exactly, no WKT round-trip
 
 3. NETWORK CONNECTIVITY:
    - Internet connection detection for map tile loading
@@ -1331,166 +1551,92 @@ with robust error handling and efficient resource management.
 # Define generic type variable for type-safe caching decorator
 T = TypeVar('T')
 
-def networkx_to_serializable(g):
+def atomic_write_bytes(path: Path, payload: bytes) -> None:
     """
-    Convert a NetworkX graph to JSON-serializable format for persistent caching.
+    Write payload to path so readers never see a partially written file.
     
-    This function transforms complex NetworkX graph objects into a format that can
-    be safely stored in JSON files for caching purposes. It handles various data
-    types including geometric objects (Shapely), sets, and custom objects.
-    
-    The serialization process:
-    1. Extracts all node data and converts non-serializable objects
-    2. Processes edge data and their attributes
-    3. Handles special objects like Shapely geometries using WKT format
-    4. Preserves graph structure and all metadata
+    The data goes to a temporary file unique to this process and thread,
+    which is then renamed over the target with os.replace (atomic on POSIX
+    and Windows). Concurrent writers simply replace each other's result.
     
     Args:
-        g: NetworkX graph object to be serialized
-        
-    Returns:
-        dict: Dictionary representation of the graph that can be JSON serialized
-        
-    Note:
-        This function is part of the caching system that dramatically improves
-        performance by avoiding repeated expensive graph generation operations.
+        path: Destination file
+        payload: Complete file contents
     """
-    from shapely.geometry import LineString, Point
-    import json
-    
-    # Initialize serializable data structure
-    data = {
-        "nodes": {},  # Node data with attributes
-        "edges": []   # Edge list with attributes
-    }
-    
-    # Helper function to convert complex objects to serializable format
-    def make_serializable(obj):
-        """Convert non-JSON-serializable objects to serializable representations."""
-        if isinstance(obj, (LineString, Point)):
-            # Convert Shapely geometry objects to Well-Known Text (WKT) format
-            return {"__geometry__": obj.wkt}
-        elif isinstance(obj, (set, frozenset)):
-            # Convert sets to lists for JSON compatibility
-            return {"__set__": list(obj)}
-        elif hasattr(obj, '__dict__'):
-            # Handle custom objects by converting to string representation
-            return {"__object__": str(obj)}
-        else:
-            # Return as-is for already serializable objects
-            return obj
+    tmp = path.with_suffix(f"{path.suffix}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_bytes(payload)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+def discard_cache_file(path: Path) -> None:
+    """
+    Delete an unreadable cache file so it is not re-read on every call.
     
-    # Process all nodes and their attributes
-    for node in g.nodes():
-        node_attrs = {}
-        for key, value in g.nodes[node].items():
-            try:
-                # Test if the value is directly JSON serializable
-                json.dumps(value)
-                node_attrs[key] = value
-            except (TypeError, ValueError):
-                # Convert non-serializable values using helper function
-                node_attrs[key] = make_serializable(value)
-        
-        # Store node with string key for JSON compatibility
-        data["nodes"][str(node)] = node_attrs
-        
-    # Process all edges and their attributes
-    for u, v, attrs in g.edges(data=True):
-        edge_attrs = {}
-        for key, value in attrs.items():
-            try:
-                # Test if the value is directly JSON serializable
-                json.dumps(value)
-                edge_attrs[key] = value
-            except (TypeError, ValueError):
-                # Convert non-serializable values using helper function
-                edge_attrs[key] = make_serializable(value)
-        
-        # Store edge as dictionary with string node identifiers
-        data["edges"].append({
-            "u": str(u),      # Source node
-            "v": str(v),      # Target node
-            "attrs": edge_attrs  # Edge attributes
-        })
-        
-    return data
+    Args:
+        path: Cache file that failed to load
+    """
+    try:
+        path.unlink(missing_ok=True)
+    except OSError as e:
+        logger.debug(f"Could not remove corrupt cache file {path}: {e}")
 
-def serializable_to_networkx(data):
+def make_cache_key(name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
     """
-    Reconstruct a NetworkX graph from serialized JSON data.
+    Hash a function name and its arguments into a cache file stem.
     
-    This function is the inverse of networkx_to_serializable(), converting
-    the JSON-compatible dictionary representation back into a fully functional
-    NetworkX graph with all original attributes and data types restored.
+    Each part is fed to blake2b-128 incrementally (NUL-separated) instead of
+    being joined into one string first. Arguments are hashed via str(), so
+    graphs key on their summary rather than their memory address.
     
-    The reconstruction process:
-    1. Creates a new empty NetworkX graph
-    2. Restores nodes with their original attributes
-    3. Reconstructs edges with preserved attribute data
-    4. Handles special data types (geometries, sets, custom objects)
-    5. Maintains graph structure and connectivity
+    Returns:
+        32-character hex digest
+    """
+    h = hashlib.blake2b(name.encode(), digest_size=16)
+    for arg in args:
+        h.update(b"\0")
+        h.update(str(arg).encode())
+    for k in sorted(kwargs):
+        h.update(f"\0{k}={kwargs[k]}".encode())
+    return h.hexdigest()
+
+def _memo_tier(maxsize: int, timeout: float) -> Tuple[Callable[[str], Optional[Tuple[float, Any]]],
+                                                       Callable[[str, float, Any], None]]:
+    """
+    Build the in-memory LRU tier shared by file_cache and offline_cache.
     
     Args:
-        data (dict): Dictionary representation from networkx_to_serializable()
+        maxsize: Results kept before the least recently used one is dropped
+        timeout: Seconds after its creation time that an entry stops being served
         
     Returns:
-        nx.Graph: Fully reconstructed NetworkX graph object
-        
-    Note:
-        This function ensures perfect round-trip conversion, preserving all
-        graph properties, attributes, and complex data types through the
-        caching process.
+        Tuple of lookup(cache_key), which returns a fresh (creation time, result)
+        entry or None, and remember(cache_key, created, value)
     """
-    from shapely.wkt import loads as wkt_loads
-    
-    # Create new empty graph to populate
-    g = nx.Graph()
-    
-    # Helper function to restore complex objects from serialized format
-    def restore_object(obj):
-        """Restore objects from their serialized representations."""
-        if isinstance(obj, dict):
-            if "__geometry__" in obj:
-                # Restore Shapely geometry objects from WKT format
-                return wkt_loads(obj["__geometry__"])
-            elif "__set__" in obj:
-                # Restore sets from their list representation
-                return set(obj["__set__"])
-            elif "__object__" in obj:
-                # Custom objects were converted to strings, keep as strings
-                return obj["__object__"]
-        # Return unchanged for standard types
-        return obj
-    
-    # Reconstruct all nodes with their attributes
-    for node_id, attrs in data["nodes"].items():
-        restored_attrs = {}
-        # Process each node attribute through restoration
-        for key, value in attrs.items():
-            restored_attrs[key] = restore_object(value)
-        
-        # Add node with proper type conversion (int if numeric, otherwise string)
-        final_node_id = int(node_id) if node_id.isdigit() else node_id
-        g.add_node(final_node_id, **restored_attrs)
-        
-    # Reconstruct all edges with their attributes
-    for edge in data["edges"]:
-        # Convert node identifiers back to proper types
-        u = int(edge["u"]) if edge["u"].isdigit() else edge["u"]
-        v = int(edge["v"]) if edge["v"].isdigit() else edge["v"]
-        
-        # Restore edge attributes
-        restored_attrs = {}
-        for key, value in edge["attrs"].items():
-            restored_attrs[key] = restore_object(value)
-        
-        # Add edge with restored attributes
-        g.add_edge(u, v, **restored_attrs)
-        
-    return g
+    # cache_key -> (creation time, result), least recently used first
+    memo: "collections.OrderedDict[str, Tuple[float, Any]]" = collections.OrderedDict()
+    memo_lock = threading.Lock()  # Planning workers call in from the thread pool
+    
+    def lookup(cache_key: str) -> Optional[Tuple[float, Any]]:
+        with memo_lock:
+            entry = memo.get(cache_key)
+            if entry is None or time.time() - entry[0] >= timeout:
+                return None
+            memo.move_to_end(cache_key)
+            return entry
+    
+    def remember(cache_key: str, created: float, value: Any) -> None:
+        with memo_lock:
+            memo[cache_key] = (created, value)
+            memo.move_to_end(cache_key)
+            while len(memo) > maxsize:
+                memo.popitem(last=False)
+    
+    return lookup, remember
 
-def file_cache(timeout: int = CACHE_TIMEOUT) -> Callable[[Callable[..., T]], Callable[..., T]]:
+def file_cache(timeout: int = CACHE_TIMEOUT, maxsize: int = 8) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """
     High-performance file-based caching decorator for expensive operations.
     
@@ -1502,10 +1648,11 @@ def file_cache(timeout: int = CACHE_TIMEOUT) -> Callable[[Callable[..., T]], Cal
     Key features:
     - Automatic cache key generation based on function parameters
     - Configurable cache expiration times
-    - Special handling for complex data types (NetworkX graphs)
+    - Results stored as JSON (road networks have their own cache in load_graph)
     - Robust error handling and cache invalidation
     - Thread-safe cache operations
     - Automatic cache directory management
+    - In-memory LRU tier so repeat calls in a session skip the disk entirely
     
     The caching system is particularly effective for:
     - Graph generation from OpenStreetMap data
@@ -1515,6 +1662,8 @@ def file_cache(timeout: int = CACHE_TIMEOUT) -> Callable[[Callable[..., T]], Cal
     
     Args:
         timeout (int): Cache expiration time in seconds (default from config)
+        maxsize (int): Results kept in memory per decorated function; these are
+            returned as-is, so callers must not mutate them
         
     Returns:
         Callable: Decorator function that wraps target functions with caching
@@ -1531,67 +1680,68 @@ def file_cache(timeout: int = CACHE_TIMEOUT) -> Callable[[Callable[..., T]], Cal
         logger.debug(f"Created cache directory: {CACHE_DIR}")
         
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        lookup, remember = _memo_tier(maxsize, timeout)
+        
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            # Identify functions that return special data types requiring custom handling
-            is_graph_function = func.__name__ in ("get_graph_and_nodes", "distance_matrix")
-            
             # Generate unique cache key from function signature and parameters
-            key_components = [
-                func.__name__,
-                ":".join(str(arg) for arg in args),
-                ":".join(f"{k}={v}" for k, v in sorted(kwargs.items()))
-            ]
-            cache_key = hashlib.sha1(":".join(key_components).encode()).hexdigest()
+            cache_key = make_cache_key(func.__name__, args, kwargs)
             cache_file = CACHE_DIR / f"{cache_key}.json"
             
+            # In-memory tier: skip the disk read and decode for repeat calls
+            entry = lookup(cache_key)
+            if entry is not None:
+                logger.debug(f"✅ Memory cache hit for {func.__name__}")
+                return cast(T, entry[1])
+            
             # Attempt to load from cache if valid file exists
             if cache_file.exists():
-                file_age = time.time() - cache_file.stat().st_mtime
+                file_mtime = cache_file.stat().st_mtime
+                file_age = time.time() - file_mtime
                 if file_age < timeout:
                     try:
                         logger.debug(f"🗂️ Loading cached result for {func.__name__}")
-                        with open(cache_file, "r") as f:
-                            cached_data = json.load(f)
-                            
-                            # Special handling for functions returning NetworkX graphs
-                            if is_graph_function and func.__name__ == "get_graph_and_nodes":
-                                graph_data, nodes = cached_data
-                                graph = serializable_to_networkx(graph_data)
-                                logger.info(f"✅ Cache hit for {func.__name__} (age: {file_age:.1f}s)")
-                                return cast(T, (graph, nodes))
-                            else:
-                                logger.info(f"✅ Cache hit for {func.__name__} (age: {file_age:.1f}s)")
-                                return cast(T, cached_data)
+                        cached_data = json_loads_bytes(cache_file.read_bytes())
+                        logger.info(f"✅ Cache hit for {func.__name__} (age: {file_age:.1f}s)")
+                        remember(cache_key, file_mtime, cached_data)
+                        return cast(T, cached_data)
                                 
-                    except (json.JSONDecodeError, IOError) as e:
+                    except (ValueError, OSError) as e:
                         logger.warning(f"🗑️ Cache corruption detected, rebuilding: {e}")
+                        discard_cache_file(cache_file)
                         # Continue to function execution if cache is corrupted
             
             # No valid cache found, execute the original function
             logger.debug(f"💾 Cache miss for {func.__name__}, executing function")
             result = func(*args, **kwargs)
+            remember(cache_key, time.time(), result)
             
             # Store result in cache for future use
             try:
-                # Special handling for functions returning NetworkX graphs
-                if is_graph_function and func.__name__ == "get_graph_and_nodes":
-                    graph, nodes = result
-                    serializable_data = (networkx_to_serializable(graph), nodes)
-                    with open(cache_file, "w") as f:
-                        json.dump(serializable_data, f, indent=2)
-                else:
-                    with open(cache_file, "w") as f:
-                        json.dump(result, f, indent=2)
+                atomic_write_bytes(cache_file, json_dumps_bytes(result))
                 logger.debug(f"💾 Successfully cached result for {func.__name__}")
-            except (TypeError, IOError) as e:
+            except (TypeError, OSError) as e:
                 logger.warning(f"⚠️ Failed to cache result for {func.__name__}: {e}")
                 
             return result
         return wrapper
     return decorator
 
-def check_internet_connection(timeout: int = 5) -> bool:
+# Endpoints for the connectivity probe: a public DNS resolver by IP (no DNS
+# lookup needed), then the OpenStreetMap servers the app actually talks to
+CONNECTIVITY_PROBES = [("1.1.1.1", 53), ("www.openstreetmap.org", 443)]
+
+# Probe results are reused for this many seconds; graph fetches, offline_cache
+# wrappers and tile selection all ask within moments of each other
+CONNECTIVITY_TTL = 30.0
+_last_connectivity: Optional[Tuple[float, bool]] = None  # (time.monotonic(), result); None forces a probe
+
+# Probes run side by side, so a check takes as long as the fastest endpoint
+# (threads are only started on the first probe)
+_PROBE_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=len(CONNECTIVITY_PROBES),
+                                                    thread_name_prefix="connectivity-probe")
+
+def check_internet_connection(timeout: float = 1.0) -> bool:
     """
     Intelligently detect internet connectivity for map tile loading.
     
@@ -1600,11 +1750,15 @@ def check_internet_connection(timeout: int = 5) -> bool:
     to multiple reliable servers to avoid false negatives from temporary outages.
     
     The connectivity test process:
-    1. Primary test: Attempts connection to Google (highly reliable)
-    2. Fallback test: Attempts connection to OpenStreetMap servers
+    1. Opens TCP connections to a public DNS resolver by IP and to the
+       OpenStreetMap servers at the same time
+    2. Reports success as soon as either connection is made
     3. Timeout handling: Uses short timeout to avoid blocking the UI
     4. Error classification: Distinguishes between different failure types
     
+    Only a TCP handshake is made - no HTTP request is sent - so an online
+    check costs a single round trip and an offline one fails fast.
+    
     This information is used to:
     - Choose appropriate map tile sources (online vs offline-friendly)
     - Adjust caching strategies for map data
@@ -1612,32 +1766,50 @@ def check_internet_connection(timeout: int = 5) -> bool:
     - Enable graceful degradation for offline operation
     
     Args:
-        timeout (int): Maximum time to wait for connection in seconds (default: 5)
+        timeout (float): Maximum time to wait for the connection attempts in seconds (default: 1)
         
     Returns:
         bool: True if internet connection is available, False otherwise
         
     Note:
         This function is designed to be fast and non-blocking to avoid
-        impacting application startup and user experience.
+        impacting application startup and user experience. The result is
+        reused for CONNECTIVITY_TTL seconds; set _last_connectivity to None
+        to force a fresh probe.
     """
+    global _last_connectivity
+    last = _last_connectivity
+    if last is not None and time.monotonic() - last[0] < CONNECTIVITY_TTL:
+        return last[1]
+    
+    result = _probe_connectivity(timeout)
+    _last_connectivity = (time.monotonic(), result)
+    return result
+
+def _probe_connectivity(timeout: float) -> bool:
+    """Probe all endpoints concurrently; True as soon as one connects."""
+    futures = [_PROBE_POOL.submit(_probe_endpoint, host, port, timeout)
+               for host, port in CONNECTIVITY_PROBES]
     try:
-        # Primary connectivity test using Google (global reliability)
-        urllib.request.urlopen('http://www.google.com', timeout=timeout)
-        logger.debug("🌐 Internet connectivity confirmed (Google)")
-        return True
-    except (urllib.error.URLError, socket.timeout, socket.error) as e:
-        logger.debug(f"Primary connectivity test failed: {e}")
-        
-        try:
-            # Fallback connectivity test using OpenStreetMap
-            urllib.request.urlopen('http://www.openstreetmap.org', timeout=timeout)
-            logger.debug("🌐 Internet connectivity confirmed (OpenStreetMap)")
+        # The extra second bounds the DNS lookup, which the socket timeout does not cover
+        for future in concurrent.futures.as_completed(futures, timeout=timeout + 1):
+            if future.result():
+                return True
+    except concurrent.futures.TimeoutError:
+        logger.debug("Connectivity probes timed out")
+            
+    logger.info("🔌 No internet connection detected")
+    return False
+
+def _probe_endpoint(host: str, port: int, timeout: float) -> bool:
+    """Try one TCP connection to host:port."""
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            logger.debug(f"🌐 Internet connectivity confirmed ({host}:{port})")
             return True
-        except (urllib.error.URLError, socket.timeout, socket.error) as e:
-            logger.debug(f"Fallback connectivity test failed: {e}")
-            logger.info("🔌 No internet connection detected")
-            return False
+    except OSError as e:
+        logger.debug(f"Connectivity test to {host}:{port} failed: {e}")
+        return False
 
 def get_offline_map_config():
     """
@@ -1666,7 +1838,7 @@ def get_offline_map_config():
         This function is called during map generation to ensure the best
         possible user experience regardless of network conditions.
     """
-    internet_available = check_internet_connection(timeout=3)
+    internet_available = check_internet_connection()
     
     if internet_available:
         # Use preferred high-quality tiles when online
@@ -1709,8 +1881,13 @@ def euclidean_distance(p1: Tuple[float, float], p2: Tuple[float, float]) -> floa
         For accurate distance measurements, use haversine_distance() instead.
         This function is optimized for speed in algorithms like TSP solving.
     """
-    # Simple Pythagorean theorem in coordinate space
-    return ((p1[0] - p2[0])**2 + (p1[1] - p2[1])**2)**0.5
+    # Simple Pythagorean theorem in coordinate space (x*x avoids float.__pow__)
+    dx = p1[0] - p2[0]
+    dy = p1[1] - p2[1]
+    return (dx*dx + dy*dy)**0.5
+
+# Math functions bound once at module level for the scalar distance helpers
+_sin, _cos, _sqrt, _atan2, _radians = math.sin, math.cos, math.sqrt, math.atan2, math.radians
 
 def haversine_distance(p1: Tuple[float, float], p2: Tuple[float, float]) -> float:
     """
@@ -1745,97 +1922,156 @@ def haversine_distance(p1: Tuple[float, float], p2: Tuple[float, float]) -> floa
         >>> print(f"Distance: {distance:.2f} km")
         Distance: 0.25 km
     """
-    from math import radians, sin, cos, sqrt, atan2
-    
     # Earth's mean radius in kilometers (WGS84 approximation)
     EARTH_RADIUS_KM = 6371.0
     
     # Convert decimal degrees to radians for trigonometric calculations
-    lat1, lon1 = radians(p1[0]), radians(p1[1])
-    lat2, lon2 = radians(p2[0]), radians(p2[1])
+    lat1, lon1 = _radians(p1[0]), _radians(p1[1])
+    lat2, lon2 = _radians(p2[0]), _radians(p2[1])
     
-    # Calculate coordinate differences
-    dlat = lat2 - lat1  # Latitude difference
-    dlon = lon2 - lon1  # Longitude difference
+    # Sines of the half coordinate differences
+    sin_dlat = _sin((lat2 - lat1) * 0.5)  # Latitude difference
+    sin_dlon = _sin((lon2 - lon1) * 0.5)  # Longitude difference
     
     # Apply haversine formula for great-circle distance
-    a = sin(dlat / 2)**2 + cos(lat1) * cos(lat2) * sin(dlon / 2)**2
-    c = 2 * atan2(sqrt(a), sqrt(1 - a))
+    a = sin_dlat*sin_dlat + _cos(lat1) * _cos(lat2) * sin_dlon*sin_dlon
+    c = 2 * _atan2(_sqrt(a), _sqrt(1 - a))
     
     # Convert angular distance to linear distance
     distance_km = EARTH_RADIUS_KM * c
     
     return distance_km
 
+def haversine_matrix(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """
+    Calculate great-circle distances between all pairs of points at once.
+    
+    Vectorized form of haversine_distance(): the n² pairs are computed with
+    NumPy broadcasting instead of n² Python-level calls.
+    
+    Args:
+        lats: Latitudes in decimal degrees, shape (n,)
+        lons: Longitudes in decimal degrees, shape (n,)
+        
+    Returns:
+        (n, n) array of great-circle distances in kilometers
+    """
+    lats = np.radians(lats)
+    lons = np.radians(lons)
+    dlat = lats[:, None] - lats[None, :]
+    dlon = lons[:, None] - lons[None, :]
+    cos_lat = np.cos(lats)
+    a = np.sin(dlat / 2)**2 + cos_lat[:, None] * cos_lat[None, :] * np.sin(dlon / 2)**2
+    return 6371.0 * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
 def cleanup_temp_files():
     """Remove temporary HTML files created for map display."""
     try:
-        # Look for temporary HTML files in the temp directory
+        # Look for temporary HTML files in the temp directory; scandir entries
+        # carry the file type, so only the .html files are stat()ed
         temp_dir = tempfile.gettempdir()
-        for filename in os.listdir(temp_dir):
-            if filename.endswith('.html') and os.path.isfile(os.path.join(temp_dir, filename)):
+        now = time.time()
+        with os.scandir(temp_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.html') or not entry.is_file(follow_symlinks=False):
+                    continue
                 # Only remove files older than 1 hour to avoid removing files in use
-                file_path = os.path.join(temp_dir, filename)
-                file_age = time.time() - os.path.getmtime(file_path)
+                file_age = now - entry.stat(follow_symlinks=False).st_mtime
                 if file_age > 3600:  # 1 hour in seconds
                     try:
-                        os.remove(file_path)
-                        logger.debug(f"Removed temp file: {file_path}")
+                        os.remove(entry.path)
+                        logger.debug(f"Removed temp file: {entry.path}")
                     except (OSError, PermissionError):
                         # Skip files that can't be removed
-                        logger.debug(f"Could not remove temp file (permission denied): {file_path}")
+                        logger.debug(f"Could not remove temp file (permission denied): {entry.path}")
     except Exception as e:
         # Don't let cleanup errors affect the application
         logger.warning(f"Error during temp file cleanup: {str(e)}")
         
+# Decorator cache files, plus temp files left by an interrupted atomic write
+# (.pkl files are graph results from older versions, left to age out)
+CACHE_FILE_SUFFIXES = (".json", ".pkl", ".tmp")
+
+# Road networks from load_graph are kept well past CACHE_TIMEOUT, since an
+# expired one is still the offline fallback, but not forever
+GRAPH_CACHE_SUFFIX = ".gpickle"
+GRAPH_CACHE_MAX_AGE = CACHE_TIMEOUT * 4
+
 def cleanup_old_cache_files():
     """Remove old cache files to prevent disk space issues."""
     try:
         if not CACHE_DIR.exists():
             return
             
-        # Check each cache file
-        for cache_file in CACHE_DIR.glob("*.json"):
-            file_age = time.time() - cache_file.stat().st_mtime
-            if file_age > CACHE_TIMEOUT:
-                try:
-                    cache_file.unlink()
-                    logger.debug(f"Removed old cache file: {cache_file}")
-                except (OSError, PermissionError):
-                    logger.debug(f"Could not remove cache file (permission denied): {cache_file}")
+        # Check each cache file, including temp files orphaned by an interrupted write,
+        # in a single directory pass
+        now = time.time()
+        with os.scandir(CACHE_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith(GRAPH_CACHE_SUFFIX):
+                    max_age = GRAPH_CACHE_MAX_AGE
+                elif entry.name.endswith(CACHE_FILE_SUFFIXES):
+                    max_age = CACHE_TIMEOUT
+                else:
+                    continue
+                file_age = now - entry.stat(follow_symlinks=False).st_mtime
+                if file_age > max_age:
+                    try:
+                        os.remove(entry.path)
+                        logger.debug(f"Removed old cache file: {entry.path}")
+                    except (OSError, PermissionError):
+                        logger.debug(f"Could not remove cache file (permission denied): {entry.path}")
                     
     except Exception as e:
         logger.warning(f"Error during cache cleanup: {str(e)}")
 
 # Enhanced caching decorator for offline functionality
-def offline_cache(timeout: int = CACHE_TIMEOUT, require_internet: bool = True):
+def offline_cache(timeout: int = CACHE_TIMEOUT, require_internet: bool = True, maxsize: int = 8,
+                  persist: bool = True):
     """
     Enhanced caching decorator that supports offline operation.
     
     Args:
         timeout: Cache expiration time in seconds
         require_internet: If False, use cached data even if expired when offline
+        maxsize: Results kept in memory per decorated function; these are
+            returned as-is, so callers must not mutate them
+        persist: If False, keep only the in-memory tier and always call the
+            function on a miss; for functions whose expensive part already has
+            its own disk cache and offline handling
         
     Returns:
         Decorator function that wraps the target function with offline-aware caching
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        lookup, remember = _memo_tier(maxsize, timeout)
+        
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
             # Create cache key
-            key_parts = [func.__name__,
-                        ":".join(str(arg) for arg in args) + 
-                        ":".join(f"{k}={v}" for k, v in sorted(kwargs.items()))]
-            cache_key = hashlib.sha1(":".join(key_parts).encode()).hexdigest()
+            cache_key = make_cache_key(func.__name__, args, kwargs)
+            
+            # In-memory tier: a fresh result skips the connectivity probe and the disk
+            entry = lookup(cache_key)
+            if entry is not None:
+                logger.debug(f"Memory cache hit for {func.__name__}")
+                return cast(T, entry[1])
+            
+            if not persist:
+                result = func(*args, **kwargs)
+                remember(cache_key, time.time(), result)
+                return result
+            
             cache_file = CACHE_DIR / f"{cache_key}.json"
             
             # Check internet connectivity
-            internet_available = check_internet_connection(timeout=3)
+            internet_available = check_internet_connection()
             
             # Check if valid cache file exists
             cache_valid = False
             if cache_file.exists():
-                file_age = time.time() - cache_file.stat().st_mtime
+                file_mtime = cache_file.stat().st_mtime
+                file_age = time.time() - file_mtime
                 cache_valid = file_age < timeout
                 
                 # If offline and cache exists (even if expired), use it
@@ -1846,62 +2082,208 @@ def offline_cache(timeout: int = CACHE_TIMEOUT, require_internet: bool = True):
             if cache_valid:
                 try:
                     logger.debug(f"Loading cached result for {func.__name__}")
-                    with open(cache_file, "r") as f:
-                        cached_data = json.load(f)
-                        
-                        # Handle special case for graph data
-                        if func.__name__ == "get_graph_and_nodes":
-                            graph_data, nodes = cached_data
-                            graph = serializable_to_networkx(graph_data)
-                            return cast(T, (graph, nodes))
-                        else:
-                            return cast(T, cached_data)
+                    cached_data = json_loads_bytes(cache_file.read_bytes())
+                    # Keyed by file age, so an expired file used offline is not served from memory
+                    remember(cache_key, file_mtime, cached_data)
+                    return cast(T, cached_data)
                             
-                except (json.JSONDecodeError, IOError) as e:
+                except (ValueError, OSError) as e:
                     logger.warning(f"Error loading cache: {e}")
+                    discard_cache_file(cache_file)
             
             # No valid cache or internet required - try to execute function
             if not internet_available and require_internet:
-                # If function requires internet but none available, provide fallback
-                logger.warning(f"No internet connection for {func.__name__}, using fallback")
-                
-                if func.__name__ == "get_graph_and_nodes":
-                    # Create a simple complete graph as fallback
-                    coords = args[0] if args else []
-                    fallback_graph = nx.complete_graph(len(coords))
-                    for i, (lat, lon) in enumerate(coords):
-                        fallback_graph.nodes[i]['x'] = lon
-                        fallback_graph.nodes[i]['y'] = lat
-                    return cast(T, (fallback_graph, list(range(len(coords)))))
-                else:
-                    raise ConnectionError(f"Internet connection required for {func.__name__}")
+                raise ConnectionError(f"Internet connection required for {func.__name__}")
             
             # Execute function
             result = func(*args, **kwargs)
+            remember(cache_key, time.time(), result)
             
             # Save result to cache
             try:
-                if func.__name__ == "get_graph_and_nodes":
-                    graph, nodes = result
-                    serializable_data = (networkx_to_serializable(graph), nodes)
-                    with open(cache_file, "w") as f:
-                        json.dump(serializable_data, f)
-                else:
-                    with open(cache_file, "w") as f:
-                        json.dump(result, f)
+                atomic_write_bytes(cache_file, json_dumps_bytes(result))
                 logger.debug(f"Cached result for {func.__name__}")
-            except (TypeError, IOError) as e:
+            except (TypeError, OSError) as e:
                 logger.warning(f"Failed to cache result: {e}")
                 
             return result
         return wrapper
     return decorator
 
-# -----------------------------------------------------------------------------
-#  GRAPH UTILITIES
-# -----------------------------------------------------------------------------
+# -----------------------------------------------------------------------------
+#  GRAPH UTILITIES
+# -----------------------------------------------------------------------------
+
+# Graphs are unhashable, so memoized queries take an integer handle from this
+# registry instead. Only the most recent graphs are kept alive; handles are
+# never reused, so cached answers for evicted graphs are simply never hit again.
+_GRAPHS: Dict[int, nx.Graph] = {}
+_GRAPHS_MAX = 4
+_next_graph_id = 0
+_GRAPHS_LOCK = threading.Lock()  # Planning workers register graphs from the thread pool
+
+def register_graph(g: nx.Graph) -> int:
+    """
+    Return the registry handle for a graph, registering it if needed.
+    
+    Args:
+        g: NetworkX graph used for memoized node and path queries
+        
+    Returns:
+        Integer handle to pass to _nearest_node and _shortest_path
+    """
+    global _next_graph_id
+    with _GRAPHS_LOCK:
+        for graph_id, known in _GRAPHS.items():
+            if known is g:
+                return graph_id
+                
+        graph_id = _next_graph_id
+        _next_graph_id += 1
+        _GRAPHS[graph_id] = g
+        while len(_GRAPHS) > _GRAPHS_MAX:
+            del _GRAPHS[next(iter(_GRAPHS))]
+        return graph_id
+
+
+@functools.lru_cache(maxsize=_GRAPHS_MAX)
+def _node_kdtree(graph_id: int) -> Tuple[Any, np.ndarray, float]:
+    """
+    Build a KD-tree over a graph's node coordinates, once per graph.
+    
+    Longitudes are scaled by the cosine of the mean latitude (a local
+    equirectangular projection), so Euclidean nearest neighbours match
+    great-circle ones at city scale.
+    
+    Returns:
+        Tuple of (cKDTree, node ID array in tree order, longitude scale)
+        
+    Raises:
+        ImportError: If SciPy is not installed
+    """
+    from scipy.spatial import cKDTree
+    
+    g = _GRAPHS[graph_id]
+    node_ids = np.array(list(g.nodes))
+    xs = np.fromiter((x for _, x in g.nodes(data="x")), dtype=np.float64, count=len(node_ids))
+    ys = np.fromiter((y for _, y in g.nodes(data="y")), dtype=np.float64, count=len(node_ids))
+    lon_scale = math.cos(math.radians(float(ys.mean())))
+    return cKDTree(np.column_stack((xs * lon_scale, ys))), node_ids, lon_scale
+
+
+def _snap_candidates(graph_id: int, lats: Sequence[float], lons: Sequence[float], k: int) -> np.ndarray:
+    """
+    Find the k graph nodes nearest to each point with one batched KD-tree query.
+    
+    Args:
+        graph_id: Registry handle from register_graph
+        lats: Point latitudes
+        lons: Point longitudes
+        k: Candidates per point (capped at the number of graph nodes)
+        
+    Returns:
+        (len(lats), k) array of node IDs, nearest first
+        
+    Raises:
+        ImportError: If SciPy is not installed
+    """
+    tree, node_ids, lon_scale = _node_kdtree(graph_id)
+    k = min(k, len(node_ids))
+    points = np.column_stack((np.asarray(lons, dtype=np.float64) * lon_scale, np.asarray(lats, dtype=np.float64)))
+    _, idx = tree.query(points, k=k)
+    return node_ids[np.asarray(idx).reshape(len(points), k)]
+
+
+@functools.lru_cache(maxsize=4096)
+def _nearest_node(graph_id: int, lat: float, lon: float) -> int:
+    """Return the graph node nearest to (lat, lon), memoized per graph."""
+    try:
+        return int(_snap_candidates(graph_id, (lat,), (lon,), 1)[0, 0])
+    except ImportError:
+        pass  # No SciPy: let OSMnx answer
+    
+    g = _GRAPHS[graph_id]
+    # Try different OSMnx versions
+    try:
+        return ox.distance.nearest_nodes(g, lon, lat)  # Newer versions
+    except (AttributeError, TypeError):
+        try:
+            return ox.get_nearest_nodes(g, lon, lat)  # Older versions
+        except AttributeError:
+            return ox.nearest_nodes(g, lon, lat)  # Very old versions
+
+
+@functools.lru_cache(maxsize=4096)
+def _shortest_path(graph_id: int, u: int, v: int) -> Tuple[int, ...]:
+    """Return the shortest road path from u to v by length, memoized per graph."""
+    return tuple(nx.shortest_path(_GRAPHS[graph_id], u, v, weight="length"))
+
+
+def load_graph(bounds: Dict[str, float]) -> nx.MultiDiGraph:
+    """
+    Load the drivable road network for a bounding box, using a disk cache.
+    
+    Graphs are pickled (zstd-compressed when zstandard is installed) under
+    CACHE_DIR keyed by a hash of the bounds, so any stop set inside an
+    already-downloaded area skips the OSM download. Entries
+    older than CACHE_TIMEOUT are refreshed, but a stale entry is still used
+    when the download fails (e.g. while offline) until cleanup_old_cache_files
+    prunes it after GRAPH_CACHE_MAX_AGE.
+    
+    Args:
+        bounds: Dictionary with 'north', 'south', 'east' and 'west' keys
+        
+    Returns:
+        The road network as returned by OSMnx
+        
+    Raises:
+        Exception: Any download error when no cached graph is available
+    """
+    key = hashlib.blake2b(json_dumps_bytes(bounds, sort_keys=True), digest_size=16).hexdigest()
+    cache_file = CACHE_DIR / f"{key}{GRAPH_CACHE_SUFFIX}"
+    
+    cached = None
+    if cache_file.exists():
+        try:
+            cached = pickle.loads(decompress_cache_bytes(cache_file.read_bytes()))
+            file_age = time.time() - os.path.getmtime(cache_file)
+            if file_age < CACHE_TIMEOUT:
+                logger.info(f"✅ Road network cache hit (age: {file_age:.1f}s)")
+                return cached
+        except (OSError, ValueError, pickle.UnpicklingError, EOFError) as e:
+            logger.warning(f"🗑️ Road network cache unreadable, refetching: {e}")
+            discard_cache_file(cache_file)
+            cached = None
+    
+    from shapely.geometry import box
+    
+    poly = box(bounds["west"], bounds["south"], bounds["east"], bounds["north"])
+    try:
+        # For OSMnx 1.0 and newer
+        try:
+            g = ox.graph_from_polygon(poly, network_type="drive")
+        # For older OSMnx versions
+        except AttributeError:
+            g = ox.graph.graph_from_polygon(poly, network_type="drive")
+    except Exception as e:
+        if cached is not None:
+            logger.warning(f"Road network download failed, using expired cache: {e}")
+            return cached
+        raise
+    
+    try:
+        atomic_write_bytes(cache_file, compress_cache_bytes(pickle.dumps(g, protocol=pickle.HIGHEST_PROTOCOL)))
+        logger.debug(f"💾 Cached road network to {cache_file}")
+    except (OSError, pickle.PicklingError) as e:
+        logger.warning(f"⚠️ Failed to cache road network: {e}")
+        
+    return g
+
+
+# Nearest nodes fetched per stop when snapping; later ones resolve duplicate
+# snaps, so the jittered re-query loop only runs if all of them are taken
+SNAP_CANDIDATES = 25
 
-@offline_cache(require_internet=True)
 def get_graph_and_nodes(coords: List[Tuple[float, float]]) -> Tuple[nx.Graph, List[int]]:
     """
     Get a road network graph and corresponding node IDs for a set of coordinates.
@@ -1916,73 +2298,101 @@ def get_graph_and_nodes(coords: List[Tuple[float, float]]) -> Tuple[nx.Graph, Li
         
     Note:
         Ensures each coordinate maps to a distinct graph node by adding small
-        random offsets when duplicate nodes are detected.
+        random offsets when duplicate nodes are detected. If no road network
+        can be loaded, a complete straight-line graph over the stops is
+        returned instead; it is never cached, so the next call retries the
+        download.
     """
-    # Extract latitude and longitude components
-    lats, lons = zip(*coords)
-    
-    # Create a bounding box with buffer around coordinates
-    poly = box(
-        min(lons) - BUFFER_SIZE, 
-        min(lats) - BUFFER_SIZE, 
-        max(lons) + BUFFER_SIZE, 
-        max(lats) + BUFFER_SIZE
-    )
-    
-    # Get the road network graph for the bounding box
-    internet_available = check_internet_connection(timeout=3)
-    
     try:
-        if not internet_available:
-            logger.warning("No internet connection available. Using cached data or fallback.")
-            # If offline, this will fail and go to fallback immediately
-            
-        # For OSMnx 1.0 and newer
-        try:
-            g = ox.graph_from_polygon(poly, network_type="drive")
-        # For older OSMnx versions
-        except AttributeError:
-            g = ox.graph.graph_from_polygon(poly, network_type="drive")
+        return _road_graph_and_nodes(coords)
+    except ImportError:
+        raise
     except Exception as e:
         logger.error(f"Error fetching road network: {str(e)}")
-        if not internet_available:
-            logger.info("Creating fallback graph for offline operation")
+        logger.info("Creating fallback graph for offline operation")
         # Fallback to simple complete graph if OSM data cannot be retrieved
         g = nx.complete_graph(len(coords))
         for i, (lat, lon) in enumerate(coords):
             g.nodes[i]['x'] = lon
             g.nodes[i]['y'] = lat
         return g, list(range(len(coords)))
+
+# Memory tier only: load_graph already keeps the road network on disk (and
+# falls back to it offline), and snapping the stops is a single KD-tree query.
+# Load failures propagate so the caller's fallback graph is never memoized.
+@offline_cache(persist=False)
+def _road_graph_and_nodes(coords: List[Tuple[float, float]]) -> Tuple[nx.Graph, List[int]]:
+    """
+    Load the road network around the stops and snap each stop to a node.
+    
+    Args:
+        coords: List of (latitude, longitude) coordinates
+        
+    Returns:
+        Tuple of the undirected road graph and one distinct node ID per stop
+        
+    Raises:
+        Exception: Any load_graph error when no road network is available
+    """
+    # Extract latitude and longitude components
+    lats, lons = zip(*coords)
+    
+    # Create a bounding box with buffer around coordinates, snapped outward to a
+    # BUFFER_SIZE grid so nearby stop sets share the same cached road network
+    bounds = {
+        "north": round(math.ceil((max(lats) + BUFFER_SIZE) / BUFFER_SIZE) * BUFFER_SIZE, 6),
+        "south": round(math.floor((min(lats) - BUFFER_SIZE) / BUFFER_SIZE) * BUFFER_SIZE, 6),
+        "east": round(math.ceil((max(lons) + BUFFER_SIZE) / BUFFER_SIZE) * BUFFER_SIZE, 6),
+        "west": round(math.floor((min(lons) - BUFFER_SIZE) / BUFFER_SIZE) * BUFFER_SIZE, 6),
+    }
+    
+    # Get the road network graph for the bounding box
+    if not check_internet_connection():
+        logger.warning("No internet connection available. Using cached data or fallback.")
+        
+    g = load_graph(bounds)
     
     # Convert to undirected graph
     g = g.to_undirected(as_view=False)
     
     try:
-        # Find nearest graph nodes to each coordinate
-        # Handle different OSMnx versions
+        graph_id = register_graph(g)
+        
+        # Find nearest graph nodes to each coordinate: one KD-tree query returns
+        # the nearest SNAP_CANDIDATES nodes per stop, the runners-up being used
+        # to resolve duplicates without re-querying
         try:
-            nodes = ox.distance.nearest_nodes(g, lons, lats)  # Newer versions
-        except (AttributeError, TypeError):
+            candidates = _snap_candidates(graph_id, lats, lons, SNAP_CANDIDATES).tolist()
+            nodes = [row[0] for row in candidates]
+        except ImportError:
+            candidates = None
+            # Handle different OSMnx versions
             try:
-                nodes = ox.get_nearest_nodes(g, lons, lats)  # Older versions
-            except AttributeError:
-                nodes = ox.nearest_nodes(g, lons, lats)  # Very old versions
+                nodes = ox.distance.nearest_nodes(g, lons, lats)  # Newer versions
+            except (AttributeError, TypeError):
+                try:
+                    nodes = ox.get_nearest_nodes(g, lons, lats)  # Older versions
+                except AttributeError:
+                    nodes = ox.nearest_nodes(g, lons, lats)  # Very old versions
+            nodes = [int(node) for node in nodes]  # NumPy ints are not JSON-cacheable
         
         # Ensure every delivery maps to a distinct graph node
         seen = set()
         new_nodes = []
         
         for idx, (lat, lon) in enumerate(coords):
+            # Prefer the next-nearest candidate over a jittered re-query
+            if candidates is not None:
+                node = next((c for c in candidates[idx] if c not in seen), None)
+                if node is not None:
+                    seen.add(node)
+                    new_nodes.append(node)
+                    continue
+            
             jitter = 0
             while True:
-                # Try different OSMnx versions
-                try:
-                    node = ox.distance.nearest_nodes(g, lon, lat)  # Newer versions
-                except (AttributeError, TypeError):
-                    try:
-                        node = ox.get_nearest_nodes(g, lon, lat)  # Older versions
-                    except AttributeError:
-                        node = ox.nearest_nodes(g, lon, lat)  # Very old versions
+                # The batch lookup above already answered the unjittered query
+                node = nodes[idx] if jitter == 0 else _nearest_node(graph_id, lat, lon)
                         
                 if node not in seen:
                     seen.add(node)
@@ -2018,6 +2428,50 @@ def get_graph_and_nodes(coords: List[Tuple[float, float]]) -> Tuple[nx.Graph, Li
     return g, nodes
 
 
+def _stop_distance_rows(g: nx.Graph, nodes: List[int]) -> np.ndarray:
+    """
+    Compute road distances between the given stops with one Dijkstra run per stop.
+    
+    Uses SciPy's compiled csgraph Dijkstra on a CSR copy of the graph when
+    SciPy is available (one call for all stops), otherwise NetworkX's
+    single-source Dijkstra. All-pairs over the whole road network is never
+    needed: only paths from the n stops matter.
+    
+    Args:
+        g: Undirected road network with 'length' edge weights (default 1)
+        nodes: Graph node IDs of the stops
+        
+    Returns:
+        (n, n) array of path lengths in meters; inf where no path exists
+    """
+    n = len(nodes)
+    try:
+        from scipy.sparse import csr_matrix
+        from scipy.sparse.csgraph import dijkstra
+    except ImportError:
+        lengths = np.full((n, n), np.inf)
+        for i, src in enumerate(nodes):
+            reached = nx.single_source_dijkstra_path_length(g, src, weight="length")
+            lengths[i] = [reached.get(tgt, np.inf) for tgt in nodes]
+        return lengths
+    
+    index = {node: i for i, node in enumerate(g.nodes())}
+    edges = list(g.edges(data="length", default=1))
+    rows = np.fromiter((index[u] for u, _, _ in edges), dtype=np.intp, count=len(edges))
+    cols = np.fromiter((index[v] for _, v, _ in edges), dtype=np.intp, count=len(edges))
+    weights = np.fromiter((w for _, _, w in edges), dtype=np.float64, count=len(edges))
+    
+    # Keep only the shortest of any parallel edges; CSR construction would sum them
+    order = np.lexsort((weights, cols, rows))
+    _, first = np.unique(rows[order] * len(index) + cols[order], return_index=True)
+    keep = order[first]
+    adjacency = csr_matrix((weights[keep], (rows[keep], cols[keep])), shape=(len(index), len(index)))
+    
+    stop_index = [index[node] for node in nodes]
+    reached = dijkstra(adjacency, directed=False, indices=stop_index)
+    return reached[:, stop_index]
+
+
 @file_cache()
 def distance_matrix(g: nx.Graph, nodes: List[int]) -> List[List[float]]:
     """
@@ -2032,59 +2486,29 @@ def distance_matrix(g: nx.Graph, nodes: List[int]) -> List[List[float]]:
         in meters between nodes[i] and nodes[j].
     """
     n = len(nodes)
-    D = [[0.0] * n for _ in range(n)]
     
-    # Try to compute all-pairs shortest paths at once to improve performance
+    def great_circle_m() -> np.ndarray:
+        lats = np.fromiter((g.nodes[node]['y'] for node in nodes), dtype=np.float64, count=n)
+        lons = np.fromiter((g.nodes[node]['x'] for node in nodes), dtype=np.float64, count=n)
+        return haversine_matrix(lats, lons) * 1000  # Convert km to m
+    
     try:
-        # For smaller graphs, use all-pairs shortest path
-        if n <= 20:
-            paths = dict(nx.all_pairs_dijkstra_path_length(g, weight="length"))
-            
-            for i, src in enumerate(nodes):
-                for j, tgt in enumerate(nodes):
-                    if i < j:  # Only compute each pair once
-                        try:
-                            D[i][j] = D[j][i] = paths[src][tgt]
-                        except KeyError:
-                            # Handle case where no path exists
-                            # Use haversine distance as fallback (great circle distance)
-                            src_lat, src_lon = g.nodes[src]['y'], g.nodes[src]['x']
-                            tgt_lat, tgt_lon = g.nodes[tgt]['y'], g.nodes[tgt]['x']
-                            D[i][j] = D[j][i] = haversine_distance((src_lat, src_lon), (tgt_lat, tgt_lon)) * 1000  # Convert km to m
-        else:
-            # For larger graphs, compute one source at a time
-            for i, src in enumerate(nodes):
-                try:
-                    # Calculate shortest paths from source node to all others
-                    lengths = nx.single_source_dijkstra_path_length(g, src, weight="length")
-                    
-                    # Fill in the distance matrix (symmetric)
-                    for j, tgt in enumerate(nodes):
-                        if i < j:  # Only compute each pair once
-                            try:
-                                D[i][j] = D[j][i] = lengths[tgt]
-                            except KeyError:
-                                # Handle case where no path exists
-                                src_lat, src_lon = g.nodes[src]['y'], g.nodes[src]['x']
-                                tgt_lat, tgt_lon = g.nodes[tgt]['y'], g.nodes[tgt]['x']
-                                D[i][j] = D[j][i] = haversine_distance((src_lat, src_lon), (tgt_lat, tgt_lon)) * 1000  # Convert km to m
-                except nx.NetworkXNoPath:
-                    # Handle case where no path exists at all
-                    for j, tgt in enumerate(nodes):
-                        if i < j:  # Only compute each pair once
-                            src_lat, src_lon = g.nodes[src]['y'], g.nodes[src]['x']
-                            tgt_lat, tgt_lon = g.nodes[tgt]['y'], g.nodes[tgt]['x']
-                            D[i][j] = D[j][i] = haversine_distance((src_lat, src_lon), (tgt_lat, tgt_lon)) * 1000  # Convert km to m
+        lengths = _stop_distance_rows(g, nodes)
+        
+        # Handle pairs where no path exists
+        # Use haversine distance as fallback (great circle distance)
+        missing = ~np.isfinite(lengths)
+        if missing.any():
+            lengths[missing] = great_circle_m()[missing]
     
     except Exception as e:
         logger.error(f"Error computing distance matrix: {str(e)}")
         # If shortest path calculation fails, fall back to direct distances
-        for i, src in enumerate(nodes):
-            src_lat, src_lon = g.nodes[src]['y'], g.nodes[src]['x']
-            for j, tgt in enumerate(nodes):
-                if i < j:  # Only compute each pair once
-                    tgt_lat, tgt_lon = g.nodes[tgt]['y'], g.nodes[tgt]['x']
-                    D[i][j] = D[j][i] = haversine_distance((src_lat, src_lon), (tgt_lat, tgt_lon)) * 1000  # Convert km to m
+        lengths = great_circle_m()
+    
+    # Mirror the upper triangle so the matrix is exactly symmetric with a zero diagonal
+    upper = np.triu(lengths, 1)
+    D = (upper + upper.T).tolist()
                 
     return D
 
@@ -2094,7 +2518,7 @@ def distance_matrix(g: nx.Graph, nodes: List[int]) -> List[List[float]]:
 #  TSP ALGORITHMS
 # -----------------------------------------------------------------------------
 
-def christofides_tsp(D: List[List[float]]) -> Tuple[List[int], float]:
+def christofides_tsp(D: np.ndarray) -> Tuple[List[int], float]:
     """
     Implement the Christofides algorithm for approximately solving the TSP.
     
@@ -2102,7 +2526,7 @@ def christofides_tsp(D: List[List[float]]) -> Tuple[List[int], float]:
     solution for metric TSPs. It has polynomial time complexity.
     
     Args:
-        D: Distance matrix where D[i][j] is the distance from i to j
+        D: Distance matrix (array or nested lists) where D[i, j] is the distance from i to j
         
     Returns:
         Tuple containing:
@@ -2113,7 +2537,9 @@ def christofides_tsp(D: List[List[float]]) -> Tuple[List[int], float]:
         ValueError: If distance matrix is invalid or empty
         NetworkXError: If graph operations fail
     """
-    if not D or len(D) == 0:
+    # Ragged nested lists are rejected here with a ValueError by NumPy itself
+    D = np.asarray(D, dtype=np.float64)
+    if D.size == 0:
         raise ValueError("Distance matrix cannot be empty")
     
     n = len(D)
@@ -2121,19 +2547,20 @@ def christofides_tsp(D: List[List[float]]) -> Tuple[List[int], float]:
         raise ValueError("Need at least 2 nodes for TSP")
     
     # Validate distance matrix is square
-    for i, row in enumerate(D):
-        if len(row) != n:
-            raise ValueError(f"Distance matrix must be square, row {i} has length {len(row)}, expected {n}")
+    if D.shape != (n, n):
+        raise ValueError(f"Distance matrix must be square, got shape {D.shape}")
     
     try:
+        # Create a complete graph with distances as weights, all edges in one call.
+        # (nx.from_numpy_array would drop zero-distance pairs as non-edges.)
+        rows, cols = np.triu_indices(n, 1)
+        weights = D[rows, cols]
+        if (weights < 0).any():
+            k = int(np.flatnonzero(weights < 0)[0])
+            i, j = int(rows[k]), int(cols[k])
+            raise ValueError(f"Distance matrix contains negative value at [{i}][{j}]: {D[i, j]}")
         G = nx.Graph()
-        
-        # Create a complete graph with distances as weights
-        for i in range(n):
-            for j in range(i+1, n):
-                if D[i][j] < 0:
-                    raise ValueError(f"Distance matrix contains negative value at [{i}][{j}]: {D[i][j]}")
-                G.add_edge(i, j, weight=D[i][j])
+        G.add_weighted_edges_from(zip(rows.tolist(), cols.tolist(), weights.tolist()))
         
         # Step 1: Find a minimum spanning tree
         T = nx.minimum_spanning_tree(G, weight="weight")
@@ -2142,12 +2569,17 @@ def christofides_tsp(D: List[List[float]]) -> Tuple[List[int], float]:
         odd_degree_nodes = [v for v, d in T.degree() if d % 2 == 1]
         
         # Step 3: Find minimum-weight perfect matching of odd-degree nodes
-        # (We maximize weight with negated distances since nx only has max_weight_matching)
+        # (We maximize weight with flipped distances since nx only has max_weight_matching;
+        # flipping around the largest pair distance keeps every weight positive at any
+        # scale and, unlike a fixed large constant, costs no float precision)
+        odd = np.asarray(odd_degree_nodes, dtype=np.intp)
+        odd_rows, odd_cols = np.triu_indices(len(odd), 1)
+        odd_u, odd_v = odd[odd_rows], odd[odd_cols]
+        odd_dist = D[odd_u, odd_v]
+        flip = odd_dist.max(initial=0.0) + 1.0
         M = nx.Graph()
         M.add_nodes_from(odd_degree_nodes)
-        for i, u in enumerate(odd_degree_nodes):
-            for v in odd_degree_nodes[i+1:]:
-                M.add_edge(u, v, weight=1_000_000 - D[u][v])  # Large constant minus distance
+        M.add_weighted_edges_from(zip(odd_u.tolist(), odd_v.tolist(), (flip - odd_dist).tolist()))
         
         matching = nx.algorithms.matching.max_weight_matching(M, maxcardinality=True)
         
@@ -2157,7 +2589,7 @@ def christofides_tsp(D: List[List[float]]) -> Tuple[List[int], float]:
         H.add_edges_from(T.edges(data=True))
         
         for u, v in matching:
-            H.add_edge(u, v, weight=D[u][v])
+            H.add_edge(u, v, weight=D[u, v])
         
         # Step 5: Find an Eulerian circuit
         eulerian_circuit = list(nx.eulerian_circuit(H, source=0))
@@ -2173,8 +2605,11 @@ def christofides_tsp(D: List[List[float]]) -> Tuple[List[int], float]:
         # Close the tour
         tour.append(0)
         
-        # Calculate total distance
-        distance = sum(D[tour[i]][tour[i+1]] for i in range(len(tour)-1))
+        # Step 7: Remove crossings left by the shortcutting with 2-opt
+        tour = _two_opt(tour, D)
+        
+        # Calculate total distance (one fancy-indexed gather over the tour's edges)
+        distance = float(D[tour[:-1], tour[1:]].sum())
         
         return tour, distance
         
@@ -2188,98 +2623,193 @@ def christofides_tsp(D: List[List[float]]) -> Tuple[List[int], float]:
         return _nearest_neighbor_fallback(D)
 
 
-def _nearest_neighbor_fallback(D: List[List[float]]) -> Tuple[List[int], float]:
+def _two_opt(tour: List[int], dist: np.ndarray, max_passes: int = 1000) -> List[int]:
+    """
+    Improve a closed tour with best-improvement 2-opt moves.
+    
+    Each pass scores every (i, j) edge pair at once: replacing edges
+    (t[i], t[i+1]) and (t[j], t[j+1]) with (t[i], t[j]) and (t[i+1], t[j+1])
+    changes the length by delta[i, j]. The most negative move is applied by
+    reversing t[i+1..j], until no move shortens the tour.
+    
+    Args:
+        tour: Closed tour starting and ending at node 0
+        dist: Symmetric distance matrix as a float64 array
+        max_passes: Upper bound on applied moves
+        
+    Returns:
+        The improved closed tour (still starting and ending at node 0)
+    """
+    t = np.asarray(tour, dtype=np.intp)
+    m = len(t) - 1  # Number of edges in the closed tour
+    if m < 4:
+        return list(tour)
+    
+    for _ in range(max_passes):
+        a, b = t[:-1], t[1:]
+        d_old = dist[a, b]
+        delta = (dist[a[:, None], a[None, :]] + dist[b[:, None], b[None, :]]
+                 - d_old[:, None] - d_old[None, :])
+        # Only non-adjacent pairs with i < j are valid moves
+        delta[np.tril_indices(m, 1)] = 0.0
+        
+        i, j = np.unravel_index(delta.argmin(), delta.shape)
+        if delta[i, j] >= -1e-9:
+            break
+        t[i + 1:j + 1] = t[i + 1:j + 1][::-1]
+    
+    return [int(v) for v in t]
+
+
+def _nearest_neighbor_fallback(D: np.ndarray) -> Tuple[List[int], float]:
     """
     Fallback nearest neighbor algorithm for TSP when Christofides fails.
     
     Args:
-        D: Distance matrix
+        D: Distance matrix (array or nested lists)
         
     Returns:
         Tuple of (tour, distance)
     """
+    D = np.asarray(D, dtype=np.float64)
     n = len(D)
     if n == 0:
         return [], 0.0
     if n == 1:
         return [0, 0], 0.0
     
-    unvisited = set(range(1, n))
+    visited = np.zeros(n, dtype=bool)
+    visited[0] = True
     tour = [0]
     current = 0
     total_distance = 0.0
     
-    while unvisited:
-        nearest = min(unvisited, key=lambda x: D[current][x])
-        total_distance += D[current][nearest]
+    for _ in range(n - 1):
+        # Nearest unvisited stop: visited ones are masked out with inf
+        nearest = int(np.where(visited, np.inf, D[current]).argmin())
+        total_distance += D[current, nearest]
         tour.append(nearest)
-        unvisited.remove(nearest)
+        visited[nearest] = True
         current = nearest
     
     # Return to start
-    total_distance += D[current][0]
+    total_distance += D[current, 0]
     tour.append(0)
     
-    return tour, total_distance
+    return tour, float(total_distance)
 
 
-def held_karp_tsp(D: List[List[float]]) -> Tuple[List[int], float]:
+def _held_karp_tables_numpy(dist: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Implement the Held-Karp dynamic programming algorithm for optimally solving the TSP.
-    
-    This algorithm guarantees the optimal solution but has exponential
-    time complexity O(2^n * n^2).
+    Fill the Held-Karp DP and parent tables using vectorized NumPy operations.
     
     Args:
-        D: Distance matrix where D[i][j] is the distance from i to j
+        dist: Square float32 distance matrix
         
     Returns:
-        Tuple containing:
-        - tour: List of node indices representing the optimal tour (starts and ends at node 0)
-        - distance: Total tour distance
+        Tuple of (dp, parent) arrays of shape (2^n, n)
     """
-    n = len(D)
+    n = dist.shape[0]
+    bit_index = np.arange(n)
+    
+    # Initialize DP table and parent pointers, indexed directly by bitmask
+    # dp[mask, j] = shortest path visiting all vertices in mask and ending at j
+    dp = np.full((1 << n, n), np.inf, dtype=np.float32)
+    parent = np.full((1 << n, n), -1, dtype=np.int16)
+    dp[1, 0] = 0.0  # Base case: start at vertex 0
+    
+    # Solve subproblems; only masks containing the starting vertex (odd masks) matter.
+    # Every predecessor mask is numerically smaller, so it is already solved.
+    for mask in range(3, 1 << n, 2):
+        # Ending vertices j in the mask (excluding the starting vertex)
+        ends = np.flatnonzero((mask >> bit_index) & 1)[1:]
+        prev_masks = mask ^ (1 << ends)
+        
+        # candidates[i, k] = best path to k over prev_mask plus the hop k -> ends[i];
+        # vertices outside prev_mask are still inf, so they never win the argmin
+        candidates = dp[prev_masks] + dist[:, ends].T
+        best_k = candidates.argmin(axis=1)
+        dp[mask, ends] = candidates[np.arange(len(ends)), best_k]
+        parent[mask, ends] = best_k
+    
+    return dp, parent
+
+
+def _held_karp_tables_jit(dist: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fill the Held-Karp DP and parent tables with plain scalar loops.
     
-    # Initialize DP table and parent pointers
-    # dp[(mask, j)] = shortest path visiting all vertices in mask and ending at j
-    dp = {(1, 0): 0.0}  # Base case: start at vertex 0
-    parent = {}
+    Same recurrence as _held_karp_tables_numpy, written for numba's nopython
+    mode, where explicit loops beat the temporary arrays of the NumPy version.
     
-    # Solve subproblems
-    for mask in range(1, 1 << n):
-        # If the mask doesn't include the starting vertex, skip
-        if not mask & 1:
-            continue
-            
-        # For each possible ending vertex j
+    Args:
+        dist: Square float32 distance matrix
+        
+    Returns:
+        Tuple of (dp, parent) arrays of shape (2^n, n)
+    """
+    n = dist.shape[0]
+    dp = np.full((1 << n, n), np.inf, dtype=np.float32)
+    parent = np.full((1 << n, n), -1, dtype=np.int16)
+    dp[1, 0] = 0.0
+    
+    for mask in range(3, 1 << n, 2):
         for j in range(1, n):
-            # If j is not in the mask, skip
             if not mask & (1 << j):
                 continue
-                
-            # Mask without j
             prev_mask = mask ^ (1 << j)
-            best = float("inf")
-            best_k = None
-            
-            # Try all possible vertices k as the second-to-last vertex
+            best = np.inf
+            best_k = -1
             for k in range(n):
-                if prev_mask & (1 << k):  # If k is in prev_mask
-                    # Distance from k to j plus best path to k
-                    candidate = dp.get((prev_mask, k), float("inf")) + D[k][j]
-                    if candidate < best:
-                        best = candidate
-                        best_k = k
-                        
-            dp[(mask, j)] = best
-            parent[(mask, j)] = best_k
+                candidate = dp[prev_mask, k] + dist[k, j]
+                if candidate < best:
+                    best = candidate
+                    best_k = k
+            dp[mask, j] = best
+            parent[mask, j] = best_k
+    
+    return dp, parent
+
+
+# Use the compiled kernel when numba is available. The first call is made
+# here so a broken numba/llvmlite install falls back instead of failing mid-solve;
+# cache=True keeps the compiled code on disk so later startups skip compilation.
+_held_karp_tables = _held_karp_tables_numpy
+if HAS_NUMBA:
+    try:
+        _held_karp_tables_jit = numba.njit(cache=True)(_held_karp_tables_jit)
+        _held_karp_tables_jit(np.zeros((2, 2), dtype=np.float32))
+        _held_karp_tables = _held_karp_tables_jit
+    except Exception as e:
+        logger.warning(f"numba unavailable for Held-Karp, using NumPy version: {e}")
+
+
+def held_karp_tsp(D: np.ndarray) -> Tuple[List[int], float]:
+    """
+    Implement the Held-Karp dynamic programming algorithm for optimally solving the TSP.
+    
+    This algorithm guarantees the optimal solution but has exponential
+    time complexity O(2^n * n^2).
+    
+    Args:
+        D: Distance matrix (array or nested lists) where D[i, j] is the distance from i to j
+        
+    Returns:
+        Tuple containing:
+        - tour: List of node indices representing the optimal tour (starts and ends at node 0)
+        - distance: Total tour distance
+    """
+    # Road distances in meters need far less than float32's ~7 significant
+    # digits, and halving the element size keeps twice the DP table in cache
+    dist = np.asarray(D, dtype=np.float32)
+    n = dist.shape[0]
+    dp, parent = _held_karp_tables(dist)
     
     # Reconstruct the optimal tour
     # Find best endpoint to return to starting vertex
     full_mask = (1 << n) - 1
-    best_distance, best_end = min(
-        (dp[(full_mask, j)] + D[j][0], j) for j in range(1, n)
-    )
+    closing = dp[full_mask, 1:] + dist[1:, 0]
+    best_end = int(closing.argmin()) + 1
     
     # Reconstruct the path
     mask = full_mask
@@ -2288,25 +2818,56 @@ def held_karp_tsp(D: List[List[float]]) -> Tuple[List[int], float]:
     
     while j != 0:
         tour_reversed.append(j)
-        new_j = parent[(mask, j)]
+        new_j = int(parent[mask, j])
         mask ^= (1 << j)  # Remove j from mask
         j = new_j
         
     tour_reversed.append(0)  # Add starting vertex again to complete the cycle
     tour = list(reversed(tour_reversed))
     
+    # Report the length from the original full-precision distances
+    D = np.asarray(D, dtype=np.float64)
+    best_distance = float(D[tour[:-1], tour[1:]].sum())
+    
     return tour, best_distance
 
+# Solver and result label for each algorithm mode (1 = Held-Karp, 2 = Christofides)
+TSP_SOLVERS = {
+    1: (held_karp_tsp, "Optimal (Held-Karp)"),
+    2: (christofides_tsp, "Christofides 1.5-approx"),
+}
+
+# Auto mode solver per problem size, built once from the configured limit:
+# sizes up to MAX_STOPS_EXACT_ALGORITHM use Held-Karp, anything larger Christofides
+ALGO_FOR_N = [TSP_SOLVERS[1]] * (MAX_STOPS_EXACT_ALGORITHM + 1)
+
+def select_tsp_solver(mode: int, n: int) -> Tuple[Callable[[np.ndarray], Tuple[List[int], float]], str]:
+    """
+    Look up the solver and label for an algorithm mode and problem size.
+    
+    Args:
+        mode: 0 = Auto, 1 = Held-Karp, 2 = Christofides
+        n: Number of points in the distance matrix (including HQ)
+        
+    Returns:
+        Tuple of (solver function, result label)
+    """
+    if mode in TSP_SOLVERS:
+        return TSP_SOLVERS[mode]
+    return ALGO_FOR_N[n] if n < len(ALGO_FOR_N) else TSP_SOLVERS[2]
+
+def solve_tsp(D: np.ndarray) -> Tuple[List[int], float]:
+    """Solve the TSP with the auto-mode algorithm for the size of D."""
+    solver, _ = select_tsp_solver(0, len(D))
+    return solver(D)
+
 # -----------------------------------------------------------------------------
 #  WORKER THREAD
 # -----------------------------------------------------------------------------
 
-class Worker(QtCore.QThread):
+class WorkerSignals(QtCore.QObject):
     """
-    Background worker thread for route planning operations.
-    
-    This ensures the GUI remains responsive during computationally 
-    intensive operations like route planning.
+    Signals for Worker, which as a QRunnable cannot define signals itself.
     
     Attributes:
         finished: Signal emitted when processing is complete, contains result data
@@ -2317,10 +2878,26 @@ class Worker(QtCore.QThread):
     finished = QtCore.pyqtSignal(dict)
     # Signal for reporting progress (0-100, status message)
     progress = QtCore.pyqtSignal(int, str)
+
+
+class Worker(QtCore.QRunnable):
+    """
+    Background task for route planning operations.
+    
+    This ensures the GUI remains responsive during computationally 
+    intensive operations like route planning. Tasks run on the shared
+    QThreadPool, so repeated solves reuse pooled threads instead of
+    creating a new thread each time.
+    
+    Attributes:
+        signals: WorkerSignals instance owned by this task
+        finished: Shortcut for signals.finished
+        progress: Shortcut for signals.progress
+    """
     
     def __init__(self, coords: List[Tuple[float, float]], mode: int):
         """
-        Initialize the worker thread.
+        Initialize the worker task.
         
         Args:
             coords: List of (latitude, longitude) coordinates for delivery points
@@ -2330,12 +2907,17 @@ class Worker(QtCore.QThread):
                   2 = Christofides (approximation)
         """
         super().__init__()
+        # The UI keeps a reference to each task; stop Qt from deleting it after run()
+        self.setAutoDelete(False)
+        self.signals = WorkerSignals()
+        self.finished = self.signals.finished
+        self.progress = self.signals.progress
         self.coords = coords
         self.mode = mode
         
     def run(self):
         """
-        Execute the route planning operation in the background thread.
+        Execute the route planning operation on a pool thread.
         
         This method:
         1. Gets a road network graph for the area
@@ -2378,7 +2960,8 @@ class Worker(QtCore.QThread):
         # Calculate distance matrix
         try:
             dist_start = time.perf_counter()
-            D = distance_matrix(g, nodes)
+            # The cached matrix is nested lists (JSON); solvers index one float64 array
+            D = np.asarray(distance_matrix(g, nodes), dtype=np.float64)
             performance_log["distance_time"] = time.perf_counter() - dist_start
             logger.info(f"Distance matrix calculation took {performance_log['distance_time']:.3f} seconds")
         except Exception as e:
@@ -2391,25 +2974,13 @@ class Worker(QtCore.QThread):
         
         self.progress.emit(60, "Planning route...")
         
-        # Select algorithm based on mode
-        if self.mode == 1:
+        # Select algorithm based on mode (auto mode picks by problem size)
+        solver, label = select_tsp_solver(self.mode, n)
+        if solver is held_karp_tsp:
             self.progress.emit(70, "Running Held-Karp algorithm...")
-            tour, dist = held_karp_tsp(D)
-            label = "Optimal (Held-Karp)"
-        elif self.mode == 2:
-            self.progress.emit(70, "Running Christofides algorithm...")
-            tour, dist = christofides_tsp(D)
-            label = "Christofides 1.5-approx"
         else:
-            # Auto mode: use optimal algorithm for small problems, approximation for larger ones
-            if n <= MAX_STOPS_EXACT_ALGORITHM:
-                self.progress.emit(70, "Running Held-Karp algorithm...")
-                tour, dist = held_karp_tsp(D)
-                label = "Optimal (Held-Karp)"
-            else:
-                self.progress.emit(70, "Running Christofides algorithm...")
-                tour, dist = christofides_tsp(D)
-                label = "Christofides 1.5-approx"
+            self.progress.emit(70, "Running Christofides algorithm...")
+        tour, dist = solver(D)
         
         performance_log["algorithm_time"] = time.perf_counter() - t0 - performance_log["graph_time"] - performance_log["distance_time"]
         logger.info(f"Algorithm execution took {performance_log['algorithm_time']:.3f} seconds")
@@ -2420,6 +2991,7 @@ class Worker(QtCore.QThread):
         # Generate complete route with all road segments
         route = []
         try:
+            graph_id = register_graph(g)
             for i in range(len(tour) - 1):
                 # Update progress with more granular information
                 progress_value = 80 + int((i / (len(tour) - 2)) * 15) if len(tour) > 2 else 95
@@ -2427,7 +2999,7 @@ class Worker(QtCore.QThread):
                 
                 # Find shortest path between consecutive tour points
                 try:
-                    path = nx.shortest_path(g, nodes[tour[i]], nodes[tour[i+1]], weight="length")
+                    path = _shortest_path(graph_id, nodes[tour[i]], nodes[tour[i+1]])
                     
                     # Extract coordinates for each node in the path
                     pts = [(g.nodes[p]['y'], g.nodes[p]['x']) for p in path]
@@ -2474,6 +3046,58 @@ class Worker(QtCore.QThread):
 # ─────────────────────────────────────────────────────────────────────────────
 #  GUI
 # ─────────────────────────────────────────────────────────────────────────────
+
+# Random generator for sample delivery point placement
+_rng = np.random.default_rng()
+
+# JavaScript injected into the base map page. __MAP__ is replaced with the
+# Folium map variable name; routePlannerSetOverlay() swaps the drawn markers
+# and polylines without reloading the page.
+MAP_OVERLAY_SCRIPT = """
+(function() {
+    var map = __MAP__;
+    var overlay = L.layerGroup().addTo(map);
+    window.routePlannerSetOverlay = function(data) {
+        overlay.clearLayers();
+        data.lines.forEach(function(line) {
+            var layer = L.polyline(line.coords, {
+                color: line.color, weight: line.weight, opacity: line.opacity
+            });
+            if (line.tooltip) { layer.bindTooltip(line.tooltip, {sticky: true}); }
+            overlay.addLayer(layer);
+        });
+        data.markers.forEach(function(m) {
+            var marker = L.marker([m.lat, m.lon], {icon: L.divIcon({
+                html: m.html, iconSize: m.icon_size, iconAnchor: m.icon_anchor, className: 'empty'
+            })});
+            if (m.tooltip) { marker.bindTooltip(m.tooltip, {sticky: true}); }
+            if (m.popup) { marker.bindPopup(m.popup, {maxWidth: m.popup_max_width}); }
+            overlay.addLayer(marker);
+        });
+    };
+})();
+"""
+
+def _map_marker(lat: float, lon: float, html: str, tooltip: Optional[str] = None,
+                popup: Optional[str] = None, icon_size: Tuple[int, int] = (40, 40),
+                popup_max_width: int = 300) -> Dict[str, Any]:
+    """Describe a div-icon marker for PlannerUI._show_map_overlay()."""
+    return {
+        "lat": lat, "lon": lon, "html": html,
+        "tooltip": tooltip, "popup": popup,
+        "icon_size": list(icon_size),
+        "icon_anchor": [icon_size[0] // 2, icon_size[1] // 2],
+        "popup_max_width": popup_max_width,
+    }
+
+def _map_line(coords: List[Tuple[float, float]], color: str, weight: int = 3,
+              opacity: float = 1.0, tooltip: Optional[str] = None) -> Dict[str, Any]:
+    """Describe a polyline for PlannerUI._show_map_overlay()."""
+    return {
+        "coords": [list(point) for point in coords],
+        "color": color, "weight": weight, "opacity": opacity, "tooltip": tooltip,
+    }
+
 class PlannerUI(QtWidgets.QMainWindow):
     """
     Main application window for the route planner.
@@ -2505,6 +3129,8 @@ class PlannerUI(QtWidgets.QMainWindow):
         # State tracking
         self.is_planning = False  # Track if planning operation is in progress
         self.hk_results: Dict[str, Any] = {}  # Storage for Held-Karp results during comparison
+        self._map_state: Optional[str] = None  # Base map page: None, "loading" or "ready"
+        self._pending_overlay: Optional[Dict[str, Any]] = None  # Overlay waiting for the page
         
         # Initialize onboarding system
         self.tutorial_manager = None
@@ -2548,6 +3174,7 @@ class PlannerUI(QtWidgets.QMainWindow):
         if HAS_WEB_ENGINE and QWebEngineView:
             self.web = QWebEngineView()
             self.web.setObjectName("map_view")
+            self.web.loadFinished.connect(self._on_map_loaded)
             self.map_view = self.web  # Alias for tutorial system
             layout.addWidget(self.web, stretch=3)
         else:
@@ -2768,6 +3395,9 @@ class PlannerUI(QtWidgets.QMainWindow):
     
     def _display_blank_map(self):
         """Display a blank map centered at the HQ location."""
+        # This page replaces the base map, so the next overlay reloads it
+        self._map_state = None
+        
         # Create a new map centered on HQ
         map_obj = folium.Map(
             location=HQ_COORD,
@@ -2833,18 +3463,33 @@ class PlannerUI(QtWidgets.QMainWindow):
             # Fall back to a blank map if there's an error
             self._display_blank_map()
 
-    def _display_stops_map(self):
+    def _show_map_overlay(self, markers: List[Dict[str, Any]], lines: List[Dict[str, Any]]):
         """
-        Display a map showing all current delivery stops without a route.
+        Replace the markers and polylines drawn over the base map.
         
-        Creates a clean map visualization with:
-        - HQ marker (green home icon)
-        - Numbered stop markers (red circles with numbers)
-        - Automatic jitter to prevent overlapping markers
-        """
-        logger.info("_display_stops_map called - creating new map with current stops")
+        The base map (tiles and HQ marker) is rendered once; later updates
+        are pushed into the live page with JavaScript instead of saving and
+        reloading a full Folium page, which would re-run Leaflet start-up,
+        refetch tiles and repeat the connectivity check.
         
-        # Create a new map centered on HQ
+        Args:
+            markers: Marker specifications from _map_marker()
+            lines: Polyline specifications from _map_line()
+        """
+        if not (HAS_WEB_ENGINE and hasattr(self.web, 'page')):
+            # Without a web engine there is no live page to update
+            self._display_blank_map()
+            return
+            
+        self._pending_overlay = {"markers": markers, "lines": lines}
+        if self._map_state is None:
+            self._load_base_map()
+        elif self._map_state == "ready":
+            self._flush_map_overlay()
+        # While loading, _on_map_loaded applies the latest pending overlay
+
+    def _load_base_map(self):
+        """Render the base map page that overlay updates are drawn onto."""
         folium_map = folium.Map(
             location=HQ_COORD,
             zoom_start=MAP_ZOOM,
@@ -2858,6 +3503,54 @@ class PlannerUI(QtWidgets.QMainWindow):
             tooltip="HQ - Headquarters"
         ).add_to(folium_map)
         
+        # Expose an update function that redraws a single overlay layer group.
+        # As a child MacroElement its script renders after the map is created.
+        from jinja2 import Template
+        overlay_hook = folium.MacroElement()
+        overlay_hook._template = Template(
+            "{% macro script(this, kwargs) %}"
+            + MAP_OVERLAY_SCRIPT.replace("__MAP__", folium_map.get_name())
+            + "{% endmacro %}"
+        )
+        overlay_hook.add_to(folium_map)
+        
+        self._map_state = "loading"
+        self._display_map(folium_map)
+
+    def _on_map_loaded(self, ok: bool):
+        """
+        Handle the web view finishing a page load.
+        
+        Args:
+            ok: Whether the page loaded successfully
+        """
+        if self._map_state != "loading":
+            return  # Some other page (e.g. the blank fallback map)
+            
+        self._map_state = "ready" if ok else None
+        if ok and self._pending_overlay is not None:
+            self._flush_map_overlay()
+
+    def _flush_map_overlay(self):
+        """Send the pending overlay to the live map page."""
+        overlay, self._pending_overlay = self._pending_overlay, None
+        self.web.page().runJavaScript(
+            f"window.routePlannerSetOverlay && window.routePlannerSetOverlay({json.dumps(overlay)});"
+        )
+
+    def _display_stops_map(self):
+        """
+        Display a map showing all current delivery stops without a route.
+        
+        Creates a clean map visualization with:
+        - HQ marker (green home icon)
+        - Numbered stop markers (red circles with numbers)
+        - Automatic jitter to prevent overlapping markers
+        """
+        logger.info("_display_stops_map called - updating map with current stops")
+        
+        markers: List[Dict[str, Any]] = []
+        
         # Get all coordinates from the table (excluding HQ)
         coords = self._get_coordinates(include_hq=False)
         logger.info(f"Current stops count: {len(coords)}")
@@ -2877,26 +3570,22 @@ class PlannerUI(QtWidgets.QMainWindow):
                     lon = original_lon + POINT_JITTER * random.random() - POINT_JITTER / 2
                 placed.add((lat, lon))
                 
-                # Create a numbered marker using DivIcon for better visibility
-                folium.Marker(
-                    location=(lat, lon),
-                    icon=folium.DivIcon(
-                        icon_size=(40, 40),
-                        icon_anchor=(20, 20),
-                        html=f'<div style="background-color:#ff6b6b; width:30px; height:30px; '
-                             f'border-radius:15px; display:flex; justify-content:center; '
-                             f'align-items:center; color:white; font-weight:bold; '
-                             f'font-size:14px; border: 2px solid white; '
-                             f'box-shadow: 0 2px 4px rgba(0,0,0,0.3);">{idx + 1}</div>',
-                    ),
+                # Create a numbered marker using a div icon for better visibility
+                markers.append(_map_marker(
+                    lat, lon,
+                    html=f'<div style="background-color:#ff6b6b; width:30px; height:30px; '
+                         f'border-radius:15px; display:flex; justify-content:center; '
+                         f'align-items:center; color:white; font-weight:bold; '
+                         f'font-size:14px; border: 2px solid white; '
+                         f'box-shadow: 0 2px 4px rgba(0,0,0,0.3);">{idx + 1}</div>',
                     tooltip=f"Stop {idx + 1}",
                     popup=f"<b>Stop {idx + 1}</b><br/>Coordinates: ({lat:.6f}, {lon:.6f})"
-                ).add_to(folium_map)
+                ))
         else:
             logger.info("No stops to display on map")
         
-        # Display the map
-        self._display_map(folium_map)
+        # Display the stops on the map
+        self._show_map_overlay(markers, [])
         logger.info("Map display completed")
 
     # ───── DELIVERY POINT MANAGEMENT ──────────────────────────────────────────────
@@ -2932,26 +3621,19 @@ class PlannerUI(QtWidgets.QMainWindow):
         # Generate new coordinates that are sufficiently far from existing ones
         max_attempts = 50
         
-        # Default values in case loop doesn't find a suitable spot
-        lat = HQ_COORD[0] + (random.random() - 0.5) * 0.03
-        lon = HQ_COORD[1] + (random.random() - 0.5) * 0.03
+        # Draw all candidate points at once with wider jitter (~±0.015° ≈ ±1.7 km)
+        candidates = np.asarray(HQ_COORD) + _rng.uniform(-0.015, 0.015, size=(max_attempts, 2))
         
-        for _ in range(max_attempts):
-            # Generate a point with wider jitter (~±0.015° ≈ ±1.7 km)
-            new_lat = HQ_COORD[0] + (random.random() - 0.5) * 0.03
-            new_lon = HQ_COORD[1] + (random.random() - 0.5) * 0.03
-            
-            # Check if it's far enough from existing points
-            too_close = False
-            for ex_coord in existing_coords:
-                # Use our utility function for distance calculation
-                if euclidean_distance((new_lat, new_lon), ex_coord) < MIN_STOP_DISTANCE:
-                    too_close = True
-                    break
-                    
-            if not too_close:
-                lat, lon = new_lat, new_lon
-                break
+        # Take the first candidate far enough from every existing point
+        # (same coordinate-space distance as euclidean_distance), or the first
+        # candidate if none qualifies
+        choice = 0
+        if existing_coords:
+            gaps = np.linalg.norm(candidates[:, None, :] - np.asarray(existing_coords)[None, :, :], axis=2)
+            far_enough = np.flatnonzero(gaps.min(axis=1) >= MIN_STOP_DISTANCE)
+            if far_enough.size:
+                choice = far_enough[0]
+        lat, lon = (float(v) for v in candidates[choice])
         
         # Set the table values
         self.table.setItem(row_idx, 0, QtWidgets.QTableWidgetItem(f"{lat:.6f}"))
@@ -3114,11 +3796,11 @@ class PlannerUI(QtWidgets.QMainWindow):
         self.status_label.setText("Initializing...")
         self.status_label.setVisible(True)
         
-        # Create and start worker thread
+        # Create the worker task and submit it to the shared thread pool
         self.worker = Worker(coords, self.alg.currentIndex())
         self.worker.finished.connect(self._handle_planning_results)
         self.worker.progress.connect(self._update_progress)
-        self.worker.start()
+        QtCore.QThreadPool.globalInstance().start(self.worker)
 
     def _set_ui_planning_state(self, is_planning: bool):
         """
@@ -3201,19 +3883,7 @@ class PlannerUI(QtWidgets.QMainWindow):
             tour: List of indices representing the tour order
             route_path: List of (lat, lon) points defining the complete route path
         """
-        # Create a new map centered on HQ
-        folium_map = folium.Map(
-            location=HQ_COORD,
-            zoom_start=MAP_ZOOM,
-            tiles=get_offline_map_config()
-        )
-        
-        # Add HQ marker
-        folium.Marker(
-            location=HQ_COORD,
-            icon=folium.Icon(color="green", icon="home"),
-            tooltip="HQ"
-        ).add_to(folium_map)
+        markers: List[Dict[str, Any]] = []
         
         # Get all coordinates
         coords = self._get_coordinates()
@@ -3234,30 +3904,22 @@ class PlannerUI(QtWidgets.QMainWindow):
                 lon += POINT_JITTER * random.random() - POINT_JITTER / 2
             placed.add((lat, lon))
             
-            # Create a numbered marker using DivIcon
-            folium.Marker(
-                location=(lat, lon),
-                icon=folium.DivIcon(
-                    icon_size=(40, 40),
-                    icon_anchor=(20, 20),
-                    html=f'<div style="background-color:#3186cc; width:30px; height:30px; '
-                         f'border-radius:15px; display:flex; justify-content:center; '
-                         f'align-items:center; color:white; font-weight:bold; '
-                         f'font-size:14px;">{order}</div>',
-                ),
+            # Create a numbered marker using a div icon
+            markers.append(_map_marker(
+                lat, lon,
+                html=f'<div style="background-color:#3186cc; width:30px; height:30px; '
+                     f'border-radius:15px; display:flex; justify-content:center; '
+                     f'align-items:center; color:white; font-weight:bold; '
+                     f'font-size:14px;">{order}</div>',
                 tooltip=f"Stop {order} (Point {idx})",
                 popup=f"Stop {order}: Point {idx}"
-            ).add_to(folium_map)
+            ))
         
         # Add route polyline
-        folium.PolyLine(
-            route_path,
-            color="yellow",
-            weight=4
-        ).add_to(folium_map)
+        lines = [_map_line(route_path, color="yellow", weight=4)]
         
-        # Display the map
-        self._display_map(folium_map)
+        # Display the route on the map
+        self._show_map_overlay(markers, lines)
 
     # ───── ALGORITHM COMPARISON METHODS ───────────────────────────────────────────
     
@@ -3288,7 +3950,7 @@ class PlannerUI(QtWidgets.QMainWindow):
         self.hk_worker = Worker(coords, 1)  # 1 = Held-Karp
         self.hk_worker.finished.connect(self._handle_held_karp_results)
         self.hk_worker.progress.connect(self._update_comparison_progress_hk)
-        self.hk_worker.start()
+        QtCore.QThreadPool.globalInstance().start(self.hk_worker)
         
     def _update_comparison_progress_hk(self, value: int, message: str):
         """
@@ -3346,7 +4008,7 @@ class PlannerUI(QtWidgets.QMainWindow):
         self.ch_worker = Worker(coords, 2)  # 2 = Christofides
         self.ch_worker.finished.connect(self._handle_comparison_results)
         self.ch_worker.progress.connect(self._update_comparison_progress_ch)
-        self.ch_worker.start()
+        QtCore.QThreadPool.globalInstance().start(self.ch_worker)
 
     def _handle_comparison_results(self, data: Dict[str, Any]):
         """
@@ -3441,19 +4103,8 @@ class PlannerUI(QtWidgets.QMainWindow):
             hk_results: Dictionary with Held-Karp results
             ch_results: Dictionary with Christofides results
         """
-        # Create a new map centered on HQ
-        folium_map = folium.Map(
-            location=HQ_COORD,
-            zoom_start=MAP_ZOOM,
-            tiles=get_offline_map_config()
-        )
-        
-        # Add HQ marker
-        folium.Marker(
-            location=HQ_COORD,
-            icon=folium.Icon(color="green", icon="home"),
-            tooltip="HQ"
-        ).add_to(folium_map)
+        markers: List[Dict[str, Any]] = []
+        lines: List[Dict[str, Any]] = []
         
         # Get all coordinates
         coords = self._get_coordinates()
@@ -3491,20 +4142,16 @@ class PlannerUI(QtWidgets.QMainWindow):
             if ch_order > 0 and ch_order < len(ch_tour) - 1:
                 popup_content += f"Christofides: Stop #{ch_order}"
             
-            # Create a numbered marker using DivIcon
-            folium.Marker(
-                location=(lat, lon),
-                icon=folium.DivIcon(
-                    icon_size=(40, 40),
-                    icon_anchor=(20, 20),
-                    html=f'<div style="background-color:#3186cc; width:30px; height:30px; '
-                         f'border-radius:15px; display:flex; justify-content:center; '
-                         f'align-items:center; color:white; font-weight:bold; '
-                         f'font-size:14px;">{idx}</div>',
-                ),
+            # Create a numbered marker using a div icon
+            markers.append(_map_marker(
+                lat, lon,
+                html=f'<div style="background-color:#3186cc; width:30px; height:30px; '
+                     f'border-radius:15px; display:flex; justify-content:center; '
+                     f'align-items:center; color:white; font-weight:bold; '
+                     f'font-size:14px;">{idx}</div>',
                 tooltip=tooltip,
                 popup=popup_content
-            ).add_to(folium_map)
+            ))
         
         # Add route polylines with different colors
         try:
@@ -3514,22 +4161,12 @@ class PlannerUI(QtWidgets.QMainWindow):
             
             # Add the route polylines
             if hk_route:
-                folium.PolyLine(
-                    hk_route,
-                    color="yellow",
-                    weight=4,
-                    opacity=0.8,
-                    tooltip="Held-Karp (Optimal)"
-                ).add_to(folium_map)
+                lines.append(_map_line(hk_route, color="yellow", weight=4,
+                                       opacity=0.8, tooltip="Held-Karp (Optimal)"))
             
             if ch_route:
-                folium.PolyLine(
-                    ch_route,
-                    color="red",
-                    weight=4,
-                    opacity=0.8,
-                    tooltip="Christofides"
-                ).add_to(folium_map)
+                lines.append(_map_line(ch_route, color="red", weight=4,
+                                       opacity=0.8, tooltip="Christofides"))
             
             # Add a legend
             legend_html = '''
@@ -3546,21 +4183,20 @@ class PlannerUI(QtWidgets.QMainWindow):
             '''
             
             # Add legend as a hidden marker with popup
-            folium.Marker(
-                location=HQ_COORD,
-                icon=folium.DivIcon(
-                    icon_size=(0, 0),
-                    html='<div style="display:none;">Legend</div>'
-                ),
-                popup=folium.Popup(legend_html, max_width=200)
-            ).add_to(folium_map)
+            markers.append(_map_marker(
+                HQ_COORD[0], HQ_COORD[1],
+                html='<div style="display:none;">Legend</div>',
+                popup=legend_html,
+                icon_size=(0, 0),
+                popup_max_width=200
+            ))
             
         except (KeyError, AttributeError, NameError):
             # If routes aren't available, show just the markers
             pass
         
-        # Display the map
-        self._display_map(folium_map)
+        # Display both routes on the map
+        self._show_map_overlay(markers, lines)
 
     # ───── ONBOARDING AND HELP METHODS ──────────────────────────────────────────
     
@@ -16,6 +16,8 @@ import shutil
 import tempfile
 from pathlib import Path
 
+from build_utils import discard_build_dir
+
 def check_requirements():
     """Check if all requirements for building AppImage are met."""
     print("Checking AppImage build requirements...")
@@ -79,7 +81,7 @@ def build_appimage():
     
     # Clean up previous build
     if build_dir.exists():
-        shutil.rmtree(build_dir)
+        discard_build_dir(build_dir)
     
     # Create build directory structure
     app_dir = build_dir / "RoutePlanner.AppDir"
@@ -91,8 +93,7 @@ def build_appimage():
     
     # Create desktop entry
     desktop_file = app_dir / "RoutePlanner.desktop"
-    with open(desktop_file, "w") as f:
-        f.write("""[Desktop Entry]
+    desktop_file.write_text("""[Desktop Entry]
 Name=Route Planner
 Exec=route-planner
 Icon=route-planner
@@ -100,18 +101,17 @@ Type=Application
 Categories=Office;Utility;
 Comment=Delivery Route Optimization Application
 Terminal=false
-""")
+""", encoding="utf-8")
     
     # Create AppRun script
     app_run = app_dir / "AppRun"
-    with open(app_run, "w") as f:
-        f.write("""#!/bin/bash
+    app_run.write_text("""#!/bin/bash
 SELF=$(readlink -f "$0")
 HERE=${SELF%/*}
 export PATH="${HERE}/usr/bin:${PATH}"
 export PYTHONPATH="${HERE}/usr/lib/python3/site-packages:${PYTHONPATH}"
 exec "${HERE}/usr/bin/route-planner" "$@"
-""")
+""", encoding="utf-8")
     os.chmod(app_run, 0o755)
     
     # Install the package into the AppDir
@@ -125,10 +125,9 @@ exec "${HERE}/usr/bin/route-planner" "$@"
     
     # Create a simple wrapper script
     wrapper_script = bin_dir / "route-planner"
-    with open(wrapper_script, "w") as f:
-        f.write(f"""#!/bin/bash
+    wrapper_script.write_text("""#!/bin/bash
 python3 -m route_planner.core "$@"
-""")
+""", encoding="utf-8")
     os.chmod(wrapper_script, 0o755)
     
     # Copy icon
@@ -17,6 +17,8 @@ import json
 import tempfile
 from pathlib import Path
 
+from build_utils import discard_build_dir
+
 def check_requirements():
     """Check if all requirements for building Flatpak are met."""
     print("Checking Flatpak build requirements...")
@@ -149,8 +151,7 @@ def create_flatpak_manifest():
     desktop_file_dir = manifest_dir
     desktop_file_dir.mkdir(parents=True, exist_ok=True)
     
-    with open(desktop_file_dir / "org.routeplanner.RoutePlanner.desktop", "w") as f:
-        f.write("""[Desktop Entry]
+    (desktop_file_dir / "org.routeplanner.RoutePlanner.desktop").write_text("""[Desktop Entry]
 Name=Route Planner
 Exec=route-planner
 Icon=org.routeplanner.RoutePlanner
@@ -158,27 +159,25 @@ Type=Application
 Categories=Office;Utility;
 Comment=Delivery Route Optimization Application
 Terminal=false
-""")
+""", encoding="utf-8")
     
     # Create launcher script
     script_dir = project_root / "scripts"
-    with open(script_dir / "flatpak-run.sh", "w") as f:
-        f.write("""#!/bin/sh
+    (script_dir / "flatpak-run.sh").write_text("""#!/bin/sh
 exec python3 -m route_planner.core "$@"
-""")
+""", encoding="utf-8")
     os.chmod(script_dir / "flatpak-run.sh", 0o755)
     
     # Save manifest
-    with open(manifest_dir / "org.routeplanner.RoutePlanner.yml", "w") as f:
-        yaml_str = json.dumps(manifest, indent=2)
-        # Convert to YAML-like format expected by flatpak-builder
-        yaml_str = yaml_str.replace('"', '')
-        yaml_str = yaml_str.replace(',', '')
-        yaml_str = yaml_str.replace('{', '')
-        yaml_str = yaml_str.replace('}', '')
-        yaml_str = yaml_str.replace('[', '')
-        yaml_str = yaml_str.replace(']', '')
-        f.write(yaml_str)
+    yaml_str = json.dumps(manifest, indent=2)
+    # Convert to YAML-like format expected by flatpak-builder
+    yaml_str = yaml_str.replace('"', '')
+    yaml_str = yaml_str.replace(',', '')
+    yaml_str = yaml_str.replace('{', '')
+    yaml_str = yaml_str.replace('}', '')
+    yaml_str = yaml_str.replace('[', '')
+    yaml_str = yaml_str.replace(']', '')
+    (manifest_dir / "org.routeplanner.RoutePlanner.yml").write_text(yaml_str, encoding="utf-8")
     
     return manifest_dir / "org.routeplanner.RoutePlanner.yml"
 
@@ -194,7 +193,7 @@ def build_flatpak(dry_run=False):
     
     # Clean up previous build if not dry run
     if build_dir.exists() and not dry_run:
-        shutil.rmtree(build_dir)
+        discard_build_dir(build_dir)
     
     # Create build directory if not dry run
     if not dry_run:
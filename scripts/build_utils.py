@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the Route Planner package builders.
+"""
+
+import os
+import shutil
+import threading
+import time
+
+
+def discard_build_dir(build_dir):
+    """
+    Move a previous build directory aside and delete it in the background.
+
+    Renaming is a single filesystem operation, so the new build can start
+    immediately while the old tree is removed on a worker thread. The thread
+    is not a daemon, so the interpreter waits for it before exiting. Trash
+    directories left behind by an interrupted run are removed first.
+    """
+    for stale_dir in build_dir.parent.glob(f"{build_dir.name}.trash.*"):
+        shutil.rmtree(stale_dir, ignore_errors=True)
+
+    trash_dir = build_dir.with_name(f"{build_dir.name}.trash.{os.getpid()}.{time.time_ns()}")
+    build_dir.rename(trash_dir)
+    threading.Thread(target=shutil.rmtree, args=(trash_dir,),
+                     kwargs={"ignore_errors": True}).start()
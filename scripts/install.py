@@ -15,6 +15,11 @@ import site
 import shutil
 from pathlib import Path
 
+# Resolve the host platform once at import time
+_SYSTEM = platform.system()
+_IS_WIN = _SYSTEM == 'Windows'
+_IS_MAC = _SYSTEM == 'Darwin'
+
 # Try to import our universal installer
 try:
     from universal_installer import UniversalInstaller
@@ -25,7 +30,7 @@ except ImportError:
 def is_admin():
     """Check if the script is running with administrator privileges."""
     try:
-        if platform.system() == 'Windows':
+        if _IS_WIN:
             import ctypes
             return ctypes.windll.shell32.IsUserAnAdmin() != 0
         else:
@@ -33,18 +38,43 @@ def is_admin():
     except:
         return False
 
+def _run_pip(args, in_process=True):
+    """
+    Run a pip command, preferring pip's in-process entry point.
+    
+    Running pip inside the current interpreter avoids starting a second
+    Python process. pip's internal API is not stable, so if importing or
+    calling it fails in any way (including a ``sys.exit`` from inside pip)
+    the command is retried with the usual ``python -m pip`` subprocess.
+    
+    Args:
+        args (list): Arguments to pass to pip (e.g. ['install', '.'])
+        in_process (bool): Whether the in-process path may be used
+    
+    Returns:
+        int: pip's exit status (0 on success)
+    """
+    if in_process:
+        try:
+            from pip._internal.cli.main import main as pip_main
+            return pip_main(list(args))
+        except (Exception, SystemExit) as e:
+            print(f"⚠️ In-process pip unavailable ({e!r}), retrying in a subprocess")
+    
+    return subprocess.run([sys.executable, '-m', 'pip', *args]).returncode
+
 def create_desktop_shortcut(app_path):
     """Create a desktop shortcut for the application."""
     try:
         home = Path.home()
-        if platform.system() == 'Windows':
+        if _IS_WIN:
             desktop = home / 'Desktop'
             # Create a batch file
             shortcut_path = desktop / 'Route Planner.bat'
             with open(shortcut_path, 'w') as f:
                 f.write(f'@echo off\nstart "" "{app_path}"')
             return True
-        elif platform.system() == 'Linux':
+        elif _SYSTEM == 'Linux':
             desktop = home / 'Desktop'
             # Create a .desktop file
             shortcut_path = desktop / 'route-planner.desktop'
@@ -59,7 +89,7 @@ Categories=Office;
 """)
             os.chmod(shortcut_path, 0o755)
             return True
-        elif platform.system() == 'Darwin':  # macOS
+        elif _IS_MAC:  # macOS
             # Create a .command file on the desktop
             desktop = home / 'Desktop'
             shortcut_path = desktop / 'Route Planner.command'
@@ -112,18 +142,22 @@ def main():
     # Install the package
     print("\n📦 Installing Route Planner package...")
     try:
-        cmd = [sys.executable, '-m', 'pip', 'install']
+        pip_args = ['install']
         if not global_install:
-            cmd.append('--user')
-        cmd.append('.')
+            pip_args.append('--user')
+        pip_args.append(str(script_dir))
         
-        subprocess.run(cmd, cwd=script_dir, check=True)
+        # User installs switch pip's target scheme, so keep those in a
+        # separate interpreter; global installs can run in-process
+        returncode = _run_pip(pip_args, in_process=global_install)
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, ['pip', *pip_args])
         print("✅ Package installed successfully!")
         
         # Create shortcut if possible
         if site.USER_BASE and 'route-planner' in str(site.USER_BASE):
-            bin_dir = Path(site.USER_BASE) / ('Scripts' if platform.system() == 'Windows' else 'bin')
-            app_path = bin_dir / ('route-planner.exe' if platform.system() == 'Windows' else 'route-planner')
+            bin_dir = Path(site.USER_BASE) / ('Scripts' if _IS_WIN else 'bin')
+            app_path = bin_dir / ('route-planner.exe' if _IS_WIN else 'route-planner')
             if app_path.exists():
                 if create_desktop_shortcut(app_path):
                     print("✅ Desktop shortcut created!")
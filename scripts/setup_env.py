@@ -7,6 +7,7 @@ This script sets up a virtual environment for the Route Planner application.
 It works on Windows, macOS, and Linux.
 """
 
+import hashlib
 import os
 import platform
 import subprocess
@@ -34,23 +35,42 @@ def main():
     # Determine the Python executable in the virtual environment
     if platform.system() == 'Windows':
         python_executable = venv_dir / 'Scripts' / 'python.exe'
-        pip_executable = venv_dir / 'Scripts' / 'pip.exe'
     else:
         python_executable = venv_dir / 'bin' / 'python'
-        pip_executable = venv_dir / 'bin' / 'pip'
     
     # Install dependencies
     if requirements_file.exists():
-        print("\n📦 Installing dependencies...")
+        # Skip pip entirely when this exact requirements file was already installed
+        stamp_file = venv_dir / '.requirements.sha256'
+        requirements_hash = hashlib.sha256(requirements_file.read_bytes()).hexdigest()
         try:
-            subprocess.run([str(pip_executable), 'install', '--upgrade', 'pip'], 
-                          check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            subprocess.run([str(pip_executable), 'install', '-r', str(requirements_file)], 
-                          check=True)
-            print("✅ Dependencies installed!")
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to install dependencies: {e}")
-            return 1
+            installed_hash = stamp_file.read_text(encoding='utf-8').strip()
+        except OSError:
+            installed_hash = None
+        
+        if installed_hash == requirements_hash:
+            print("\n✅ Dependencies already installed")
+        else:
+            print("\n📦 Installing dependencies...")
+            try:
+                # The pip upgrade is quick, so its output is discarded; the
+                # requirements install keeps pip's progress on the terminal
+                subprocess.run([str(python_executable), '-m', 'pip', 'install', '-q',
+                                '--upgrade', 'pip'],
+                               check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+                subprocess.run([str(python_executable), '-m', 'pip', 'install',
+                                '-r', str(requirements_file)],
+                               check=True)
+                stamp_file.write_text(requirements_hash, encoding='utf-8')
+                print("✅ Dependencies installed!")
+            except subprocess.CalledProcessError as e:
+                print(f"❌ Failed to install dependencies: {e}")
+                # Only the pip upgrade's stderr is captured; show its tail, which
+                # holds pip's ERROR: lines (the main install already printed its own)
+                stderr = (e.stderr or b'').decode(errors='replace')
+                if stderr:
+                    print(stderr[-500:])
+                return 1
     else:
         print(f"❌ Requirements file not found: {requirements_file}")
         return 1